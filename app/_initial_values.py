@@ -1,19 +1,22 @@
-from typing import List
+from typing import Dict, List, Tuple
 from pydantic import EmailStr, SecretStr
 from .config import ADMIN_EMAIL, ADMIN_NAME, ADMIN_PASS
-from .dictionary.schemas import DictionarySchema
+from .dictionary.schemas import TranslationSchema, WordSchema
 from .language.crud import add_lang, get_all_langs
-from .language.schemas import LanguageSchema
-from .tutorial.dist_type.crud import add_dist_type, get_all_dist_types
-from .tutorial.dist_type.schemas import DistTypeSchema
-from .tutorial.theme.crud import add_theme, get_all_themes
-from .tutorial.theme.schemas import ThemeSchema
-from .tutorial.type.crud import add_type, get_all_types
-from .tutorial.type.schemas import TypeSchema
+from .language.schemas import LangCode, LanguageSchema
+from .tutorial.dist_type.crud import add_dist_type_word
+from .tutorial.theme.crud import add_theme_word
+from .tutorial.theme.schemas import ThemeWordSchema
+from .tutorial.type.crud import add_type_word
+from .tutorial.type.schemas import TypeCode
 from .user.crud import add_user
 from .user.schemas import UserSchema
 
 
+def translations(lang_codes: List[LangCode], values: Tuple[str, ...]) -> List[TranslationSchema]:
+    return [TranslationSchema(lang_code=lang_code, dict_value=value) for lang_code, value in zip(lang_codes, values)]
+
+
 async def insert_default_data(db_session) -> None:
 
     # 1. Default Languages
@@ -21,35 +24,29 @@ async def insert_default_data(db_session) -> None:
     await add_lang(LanguageSchema(abbreviation="rus", lang_value="русский", is_ui_lang=True), db_session=db_session)
     await add_lang(LanguageSchema(abbreviation="ukr", lang_value="українська", is_ui_lang=True), db_session=db_session)
     langs: List[LanguageSchema] = await get_all_langs(db_session=db_session)
-    eng = langs[0]
-    rus = langs[1]
-    ukr = langs[2]
+    # by abbreviation, the order of the list depends on the collation of the names
+    codes_by_abbr: Dict[str, LangCode] = {lang.abbreviation: lang.lang_code for lang in langs}
+    lang_codes: List[LangCode] = [codes_by_abbr[abbr] for abbr in ("eng", "rus", "ukr")]  # the order of the values
 
     # 2. Distribution Types
-    await add_dist_type(DictionarySchema(lang_code=eng.lang_code, dict_value="free"), db_session=db_session)
-    await add_dist_type(DictionarySchema(lang_code=eng.lang_code, dict_value="freemium"), db_session=db_session)
-    await add_dist_type(DictionarySchema(lang_code=eng.lang_code, dict_value="for money"), db_session=db_session)
-    dt_eng: List[DistTypeSchema] = await get_all_dist_types(ui_lang_code=eng.lang_code, db_session=db_session)
-    await add_dist_type(DictionarySchema(word_code=dt_eng[0].word_code, lang_code=rus.lang_code, dict_value="бесплатно"), db_session=db_session)
-    await add_dist_type(DictionarySchema(word_code=dt_eng[0].word_code, lang_code=ukr.lang_code, dict_value="безкоштовно"), db_session=db_session)
-    await add_dist_type(DictionarySchema(word_code=dt_eng[1].word_code, lang_code=rus.lang_code, dict_value="частично бесплатно"), db_session=db_session)
-    await add_dist_type(DictionarySchema(word_code=dt_eng[1].word_code, lang_code=ukr.lang_code, dict_value="частково безкоштовно"), db_session=db_session)
-    await add_dist_type(DictionarySchema(word_code=dt_eng[2].word_code, lang_code=rus.lang_code, dict_value="за деньги"), db_session=db_session)
-    await add_dist_type(DictionarySchema(word_code=dt_eng[2].word_code, lang_code=ukr.lang_code, dict_value="за гроші"), db_session=db_session)
+    for values in (
+            ("free", "бесплатно", "безкоштовно"),
+            ("freemium", "частично бесплатно", "частково безкоштовно"),
+            ("for money", "за деньги", "за гроші"),
+    ):
+        await add_dist_type_word(WordSchema(translations=translations(lang_codes, values)), db_session=db_session)
 
     # 3. Tutorial Types
-    await add_type(DictionarySchema(lang_code=eng.lang_code, dict_value="Programming"), db_session=db_session)
-    types_eng: List[TypeSchema] = await get_all_types(ui_lang_code=eng.lang_code, db_session=db_session)
-    prog_eng = types_eng[0]
-    await add_type(DictionarySchema(word_code=prog_eng.word_code, lang_code=rus.lang_code, dict_value="Программирование"),db_session=db_session)
-    await add_type(DictionarySchema(word_code=prog_eng.word_code, lang_code=ukr.lang_code, dict_value="Програмування"), db_session=db_session)
+    prog_code: TypeCode = await add_type_word(
+        WordSchema(translations=translations(lang_codes, ("Programming", "Программирование", "Програмування"))),
+        db_session=db_session,
+    )
 
     # 4. Tutorial Themes
-    await add_theme(ThemeSchema(lang_code=eng.lang_code, dict_value="Python", type_code=prog_eng.type_code), db_session=db_session)
-    themes_eng: List[ThemeSchema] = await get_all_themes(ui_lang_code=eng.lang_code, db_session=db_session)
-    python_eng = themes_eng[0]
-    await add_theme(ThemeSchema(type_code=prog_eng.type_code, word_code=python_eng.word_code, lang_code=rus.lang_code, dict_value="Python"), db_session=db_session)
-    await add_theme(ThemeSchema(type_code=prog_eng.type_code, word_code=python_eng.word_code, lang_code=ukr.lang_code, dict_value="Python"), db_session=db_session)
+    await add_theme_word(
+        ThemeWordSchema(type_code=prog_code, translations=translations(lang_codes, ("Python", "Python", "Python"))),
+        db_session=db_session,
+    )
 
     # 5. Admin
     await add_user(
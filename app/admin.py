@@ -1,12 +1,14 @@
 from typing import List
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from starlette import status
 from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
 from app.common.constants import Credential, DecodedCredential, PageVars
+from app.common.responses import CommonResponses, ResponseSchema
 from app.db import DBSession
 from app.language.crud import UILangCode, get_all_langs
 from app.language.schemas import LanguageSchema
+from app.locales import locales, publish_locales
 from app.render import render_template
 from app.tutorial.dist_type.crud import get_all_dist_types
 from app.tutorial.dist_type.schemas import DistTypeSchema
@@ -66,6 +68,7 @@ async def admin(ui_lang_code: UILangCode, db_session: DBSession, request: Reques
             request=request,
             db_session=db_session,
             page_vars=page_vars,
+            stream=True,
         )
     else:
         page_vars = {
@@ -78,3 +81,11 @@ async def admin(ui_lang_code: UILangCode, db_session: DBSession, request: Reques
             db_session=db_session,
             page_vars=page_vars,
         )
+
+
+@admin_router.post("/{ui_lang_code}/locales/reload", dependencies=[Depends(is_admin)])
+async def reload_locales(ui_lang_code: UILangCode) -> ResponseSchema:
+    # only the changed files are read again, the other workers follow the published version
+    locales.reload()
+    await publish_locales()
+    return CommonResponses.SUCCESS
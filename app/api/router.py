@@ -0,0 +1,103 @@
+from typing import Annotated
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import ORJSONResponse
+from starlette import status
+from starlette.responses import Response
+from ..common.routing import TimedRoute
+from ..db import DBSession
+from ..language.crud import UILangCode
+from ..language.schemas import LangCode
+from ..registry import Taxonomy, registry
+from ..tools import etag_matches, parameter_checker
+from ..tutorial.crud import get_all_tutorials, get_tutorial, search_tutorials
+from ..tutorial.dist_type.schemas import DistTypeCode
+from ..tutorial.schemas import Cursor, DecodedTutorialSchema, Pagination, SearchQuery, TutorialID, TutorialListSchema, \
+    TutorialSort
+from ..tutorial.theme.schemas import ThemeCode
+from ..tutorial.type.schemas import TypeCode
+
+
+api_router = APIRouter(
+    prefix="/api/v1",
+    tags=["API v1"],
+    default_response_class=ORJSONResponse,
+    route_class=TimedRoute,
+)
+
+
+@api_router.get("/tt/{ui_lang_code}", response_model_exclude_none=True)
+@parameter_checker()
+async def api_get_all_tutorials(
+        db_session: DBSession,
+        ui_lang_code: UILangCode,
+        page: Pagination = 1,
+        cursor: Cursor | None = None,
+        type_code: TypeCode | None = None,
+        theme_code: ThemeCode | None = None,
+        dist_type_code: DistTypeCode | None = None,
+        tutor_lang_code: LangCode | None = None,
+        sort: TutorialSort | None = None,
+) -> TutorialListSchema:
+
+    return await get_all_tutorials(
+        ui_lang_code=ui_lang_code,
+        type_code=type_code,
+        theme_code=theme_code,
+        dist_type_code=dist_type_code,
+        tutor_lang_code=tutor_lang_code,
+        sort=sort,
+        page=page,
+        cursor=cursor,
+        db_session=db_session,
+    )
+
+
+@api_router.get("/tt/{ui_lang_code}/search", response_model_exclude_none=True)
+@parameter_checker()
+async def api_search_tutorials(
+        db_session: DBSession,
+        ui_lang_code: UILangCode,
+        q: Annotated[SearchQuery, Query(min_length=2, max_length=256)],
+        page: Pagination = 1,
+        cursor: Cursor | None = None,
+) -> TutorialListSchema:
+
+    return await search_tutorials(
+        search_query=q,
+        ui_lang_code=ui_lang_code,
+        page=page,
+        cursor=cursor,
+        db_session=db_session,
+    )
+
+
+@api_router.get("/tt/{ui_lang_code}/{tutor_id}", response_model_exclude_none=True)
+@parameter_checker()
+async def api_get_tutorial(
+        db_session: DBSession,
+        ui_lang_code: UILangCode,
+        tutor_id: TutorialID,
+) -> DecodedTutorialSchema:
+
+    return await get_tutorial(
+        tutor_id=tutor_id,
+        ui_lang_code=ui_lang_code,
+        db_session=db_session,
+    )
+
+
+@api_router.get("/taxonomy/{ui_lang_code}", response_class=Response)
+@parameter_checker()
+async def api_get_taxonomy(
+        db_session: DBSession,
+        ui_lang_code: UILangCode,
+        if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Types -> themes, distribution types and languages, prebuilt by the registry."""
+
+    taxonomy: Taxonomy = await registry.get(db_session)
+    etag: str = taxonomy.etag(ui_lang_code)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}  # may be stored, but is revalidated every time
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=taxonomy.trees[ui_lang_code], media_type="application/json", headers=headers)
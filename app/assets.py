@@ -0,0 +1,142 @@
+"""
+Fingerprinted and precompressed static files.
+
+'build' (called in 'lifespan', or at build time as 'python -m app.assets') copies every file of 'static'
+to the build directory as '<name>.<hash><suffix>' together with its '.gz' and '.br' variants
+(brotli needs the 'brotli' package) and writes 'manifest.json'. The hash is of the content,
+so files that are already built are skipped and the old ones stay for the pages rendered before a deployment.
+The templates get the URLs from 'static_url'. The hashed names are served with 'immutable',
+the original ones and the outdated hashes (a page rendered before a deployment) get the current file
+and are revalidated. The variant is picked by Accept-Encoding, nothing is compressed at runtime
+('CompressionMiddleware' skips responses with 'Content-Encoding').
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from pathlib import Path
+from typing import Dict, Mapping, Tuple
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+from .common.constants import STATIC_CACHE_CONTROL, static_build_dir, static_dir
+from .compression import negotiate
+from .tools import etag_matches
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HASHED_NAME = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{12}(?P<suffix>\.[^./]+)?$")
+
+
+def fingerprint(name: str, content: bytes) -> str:
+    path = Path(name)
+    return path.with_name(f"{path.stem}.{hashlib.sha256(content).hexdigest()[:12]}{path.suffix}").as_posix()
+
+
+def write_file(path: Path, content: bytes) -> None:
+    """Atomic, the workers may build at the same time."""
+    temp: Path = path.with_name(f".{path.name}.{os.getpid()}")
+    temp.write_bytes(content)
+    os.replace(temp, path)
+
+
+def compressed_variants(content: bytes) -> Dict[str, bytes]:
+    """By file suffix, only the ones smaller than the original."""
+    variants: Dict[str, bytes] = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli: variants[".br"] = brotli.compress(content, quality=11)
+    return {suffix: data for suffix, data in variants.items() if len(data) < len(content)}
+
+
+class StaticAssets:
+
+    encodings: Mapping[str, str] = {"br": ".br", "gzip": ".gz"}  # file suffixes by preference
+
+    def __init__(self, directory: Path, build_dir: Path) -> None:
+        self.directory = directory
+        self.build_dir = build_dir
+        self.manifest: Mapping[str, str] = {}  # hashed names by original ones
+        self._originals: Mapping[str, str] = {}
+        self._files: Dict[str, Tuple[Path, os.stat_result]] = {}
+        self.version: str = ""
+
+    def build(self) -> Mapping[str, str]:
+        self.build_dir.mkdir(parents=True, exist_ok=True)
+        manifest: Dict[str, str] = {}
+        for path in sorted(self.directory.rglob("*")):
+            if not path.is_file(): continue
+            content: bytes = path.read_bytes()
+            name: str = path.relative_to(self.directory).as_posix()
+            manifest[name] = fingerprint(name, content)
+            target: Path = self.build_dir.joinpath(manifest[name])
+            if target.exists(): continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            for suffix, data in compressed_variants(content).items():
+                write_file(target.with_name(target.name + suffix), data)
+            write_file(target, content)  # the last one, it marks the file as built
+
+        write_file(self.build_dir.joinpath("manifest.json"), json.dumps(manifest, indent=2).encode())
+        self._files = {
+            path.relative_to(self.build_dir).as_posix(): (path, path.stat())
+            for hashed in manifest.values()
+            for path in self.build_dir.glob(f"{hashed}*")
+        }
+        self._originals = {hashed: name for name, hashed in manifest.items()}
+        self.manifest = manifest
+        self.version = hashlib.blake2b("|".join(manifest.values()).encode(), digest_size=8).hexdigest()
+        return manifest
+
+    def url(self, name: str) -> str:
+        return f"/static/{self.manifest.get(name, name)}"
+
+    def original(self, name: str) -> str:
+        if name in self.manifest: return name
+        if match := HASHED_NAME.match(name): return match["stem"] + (match["suffix"] or "")
+        return name
+
+    def get_response(self, request: Request) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=status.HTTP_405_METHOD_NOT_ALLOWED)
+
+        name: str = request.scope["path"].lstrip("/")
+        if name in self._originals:
+            hashed, cache_control = name, STATIC_CACHE_CONTROL
+        elif (original := self.original(name)) in self.manifest:
+            hashed, cache_control = self.manifest[original], "no-cache"
+        else:
+            return PlainTextResponse("Not Found", status_code=status.HTTP_404_NOT_FOUND)
+
+        headers: Dict[str, str] = {"ETag": f'"{hashed}"', "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # the same choice as 'CompressionMiddleware' makes, among the variants of this file
+        encoding: str | None = negotiate(
+            request.headers.get("accept-encoding", ""),
+            [encoding for encoding, suffix in self.encodings.items() if hashed + suffix in self._files],
+        )
+        variant: str = hashed + self.encodings[encoding] if encoding else hashed
+        if encoding: headers["Content-Encoding"] = encoding
+
+        path, stat_result = self._files[variant]
+        media_type: str = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.version: self.build()
+        response: Response = self.get_response(Request(scope))
+        await response(scope, receive, send)
+
+
+static_assets = StaticAssets(static_dir, static_build_dir)
+
+
+if __name__ == "__main__":
+    for original, hashed in static_assets.build().items():
+        print(original, "->", hashed)
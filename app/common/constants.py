@@ -1,15 +1,88 @@
 from dataclasses import dataclass
 from enum import IntEnum, StrEnum
 from pathlib import Path
+from typing import Dict, Tuple
+from jinja2 import BytecodeCache, FileSystemBytecodeCache
 from starlette.templating import Jinja2Templates
+from app.config import TEMPLATES_AUTO_RELOAD, TEMPLATES_CACHE_DIR
+
+
+def bytecode_cache(directory: str) -> BytecodeCache | None:
+    if not directory: return None
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
 
 
 templates_dir = Path(__name__.split(".")[0]).joinpath("templates")
-templates = Jinja2Templates(directory=templates_dir)
+templates = Jinja2Templates(
+    directory=templates_dir,
+    auto_reload=TEMPLATES_AUTO_RELOAD,
+    bytecode_cache=bytecode_cache(TEMPLATES_CACHE_DIR),
+)
+static_dir = Path(__name__.split(".")[0]).joinpath("static")
+static_build_dir = Path(__name__.split(".")[0]).joinpath("static-build")  # see 'app/assets.py'
+STATIC_CACHE_CONTROL: str = "public, max-age=31536000, immutable"  # fingerprinted files
 
 DEFAULT_UI_LANGUAGE: str = "eng"
+UI_LANG_COOKIE: str = "ui_lang"  # abbreviation of the last used UI language
+UI_LANG_COOKIE_MAX_AGE: int = 60 * 60 * 24 * 365  # seconds
+# Accept-Language gives ISO 639-1 codes, the languages are stored by ISO 639-2 abbreviations
+LANGUAGE_TAGS: Dict[str, str] = {"en": "eng", "ru": "rus", "uk": "ukr"}
 PAGINATION_OFFSET: int = 10
 
+# Postgres text search configurations by language abbreviation,
+# the same mapping is used by the 'tutorial_search_config' SQL function (see migrations)
+SEARCH_CONFIGS: Dict[str, str] = {"eng": "english", "rus": "russian"}
+DEFAULT_SEARCH_CONFIG: str = "simple"
+
+AUTOCOMPLETE_LIMIT: int = 10
+AUTOCOMPLETE_EXPIRE: int = 60  # seconds
+
+IMPORT_BATCH_SIZE: int = 500
+EXPORT_BATCH_SIZE: int = 1000
+
+# query parameters that don't change the linked page, they are dropped before 'source_link' is hashed
+TRACKING_PARAMS: Tuple[str, ...] = ("utm_", "fbclid", "gclid", "yclid", "msclkid", "mc_cid", "mc_eid", "_ga")
+LINK_HASH_BATCH_SIZE: int = 1000
+
+# click-throughs are counted in a Redis hash and flushed to 'tutorial_visits' in the background
+VISITS_KEY: str = "tutorial-visits"
+VISITS_FLUSH_INTERVAL: int = 5  # seconds
+# source links of the redirects, read together with the click count
+LINK_KEY: str = "tutorial-link"
+LINK_EXPIRE: int = 60 * 60 * 24  # seconds
+
+# the taxonomy version published by the process that changed it, see 'app/registry.py'
+REGISTRY_VERSION_KEY: str = "registry-version"
+REGISTRY_SYNC_INTERVAL: int = 2  # seconds, the locale version is checked with it
+LOCALES_VERSION_KEY: str = "locales-version"
+
+# rendered tutorial cards, see 'app/tutorial/fragments.py'
+FRAGMENT_KEY: str = "fragment:tutorial"
+FRAGMENT_CACHE_SIZE: int = 4096  # cards kept in the memory of every process
+FRAGMENT_EXPIRE: int = 60 * 60 * 24  # seconds
+
+# anonymous HTML pages, see 'app/pages.py'
+PAGE_KEY: str = "page-html"
+PAGE_TAG_KEY: str = "page-tag"
+PAGE_EPOCH_KEY: str = "page-epoch"  # incremented by every purge
+PAGE_EXPIRE: int = 300  # seconds
+
+# pages rendered with 'render_template(stream=True)'
+STREAM_CHUNK_SIZE: int = 16 * 1024  # characters
+
+
+class PageDirection(StrEnum):
+    next = "n"
+    prev = "p"
+
+
+class WordKind(IntEnum):
+    """What a 'dictionary' word names, the words are unique by (kind, lang_code, value)."""
+    type = 1
+    theme = 2
+    dist_type = 3
+
 
 class Credential(IntEnum):
     user = 1
@@ -39,6 +112,10 @@ class Table:
         id: str = "id"
         tutorial_id: str = ".".join([table_name, id])
 
+    @dataclass
+    class TutorialVisits:
+        table_name: str = "tutorial_visits"
+
     @dataclass
     class Language:
         table_name: str = "language"
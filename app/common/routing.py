@@ -0,0 +1,23 @@
+import time
+from typing import Callable
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class TimedRoute(APIRoute):
+    """
+    Adds the 'Server-Timing' header with the time spent on the request
+    (dependencies, the endpoint and serialization), in milliseconds.
+    """
+
+    def get_route_handler(self) -> Callable:
+        route_handler = super().get_route_handler()
+
+        async def timed_route_handler(request: Request) -> Response:
+            start = time.perf_counter()
+            response: Response = await route_handler(request)
+            response.headers["Server-Timing"] = f"app;dur={(time.perf_counter() - start) * 1000:.2f}"
+            return response
+
+        return timed_route_handler
@@ -0,0 +1,220 @@
+"""
+Response compression with br, zstd or gzip.
+
+The encoding is negotiated from Accept-Encoding (q-values, then br > zstd > gzip), brotli and zstd
+need the 'brotli' and 'zstandard' packages. It's the only place that compresses at runtime: the page cache,
+the streamed pages and the export send identity bodies. Responses that are already encoded
+(the precompressed static files, they pick their variant with 'negotiate' too) and the ones that aren't text
+pass as they are.
+A whole body is compressed once: the variants are kept in an LRU bounded by bytes and keyed by
+the encoding, the level and a digest of the body, so the same page or JSON list served again costs a digest.
+Streamed bodies are compressed chunk by chunk and flushed, they aren't cached.
+Every compressed response reports the CPU time in Server-Timing: 'compress' is what it cost,
+'compress-saved' is what the cached variant cost once. The totals are in 'hits', 'misses' and 'cpu_saved'.
+"""
+
+import hashlib
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Tuple, Type
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class GzipStream:
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, last: bool) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class BrotliStream:
+
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes, last: bool) -> bytes:
+        return self._compressor.process(data) + (self._compressor.finish() if last else self._compressor.flush())
+
+
+class ZstdStream:
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, last: bool) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_FINISH if last else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+
+Stream = GzipStream | BrotliStream | ZstdStream
+
+# by preference
+ENCODERS: Dict[str, Type[Stream]] = {
+    **({"br": BrotliStream} if brotli else {}),
+    **({"zstd": ZstdStream} if zstandard else {}),
+    "gzip": GzipStream,
+}
+DEFAULT_LEVELS: Mapping[str, int] = {"br": 4, "zstd": 3, "gzip": 6}
+
+TEXT_TYPES: Tuple[str, ...] = (
+    "application/json", "application/x-ndjson", "application/javascript", "application/xml", "image/svg+xml",
+)
+
+VariantKey = Tuple[str, int, bytes]
+Variant = Tuple[bytes, float]  # compressed body, CPU seconds it took
+
+
+def negotiate(accept_encoding: str, encodings: List[str]) -> str | None:
+    """The highest q-value wins, the order of 'encodings' breaks the ties."""
+    weights: Dict[str, float] = {}
+    for token in accept_encoding.lower().split(","):
+        name, _, params = token.partition(";")
+        try:
+            weights[name.strip()] = float(params.strip().removeprefix("q=")) if params else 1.0
+        except ValueError:
+            continue
+
+    best: str | None = None
+    for encoding in encodings:
+        weight: float = weights.get(encoding, weights.get("*", 0.0))
+        if weight > 0 and (best is None or weight > weights.get(best, weights.get("*", 0.0))):
+            best = encoding
+    return best
+
+
+def is_text(content_type: str) -> bool:
+    media_type: str = content_type.split(";")[0].strip().lower()
+    return media_type.startswith("text/") or media_type in TEXT_TYPES or media_type.endswith(("+json", "+xml"))
+
+
+class VariantCache:
+
+    def __init__(self, size: int) -> None:
+        self.size = size  # bytes of the compressed bodies
+        self.used: int = 0
+        self._variants: OrderedDict[VariantKey, Variant] = OrderedDict()
+
+    def get(self, key: VariantKey) -> Variant | None:
+        variant: Variant | None = self._variants.get(key)
+        if variant is not None: self._variants.move_to_end(key)
+        return variant
+
+    def set(self, key: VariantKey, variant: Variant) -> None:
+        if len(variant[0]) > self.size: return
+        if (old := self._variants.pop(key, None)) is not None: self.used -= len(old[0])
+        self._variants[key] = variant
+        self.used += len(variant[0])
+        while self.used > self.size:
+            self.used -= len(self._variants.popitem(last=False)[1][0])
+
+
+class CompressionMiddleware:
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            minimum_size: int = 500,
+            levels: Mapping[str, int] | None = None,
+            cache_size: int = 32 * 1024 * 1024,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels: Mapping[str, int] = {**DEFAULT_LEVELS, **(levels or {})}
+        self.cache = VariantCache(cache_size)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.cpu_saved: float = 0.0  # seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            encoding: str | None = negotiate(Headers(scope=scope).get("accept-encoding", ""), list(ENCODERS))
+            if encoding:
+                await self.app(scope, receive, CompressionResponder(self, encoding, send).send)
+                return
+        await self.app(scope, receive, send)
+
+    def compress(self, encoding: str, body: bytes) -> Tuple[bytes, float, float]:
+        """Returns the compressed body, the CPU seconds spent and saved."""
+        started: float = time.thread_time()
+        level: int = self.levels[encoding]
+        key: VariantKey = (encoding, level, hashlib.blake2b(body, digest_size=16).digest())
+        if variant := self.cache.get(key):
+            self.hits += 1
+            self.cpu_saved += variant[1]
+            return variant[0], time.thread_time() - started, variant[1]
+
+        compressed: bytes = ENCODERS[encoding](level).compress(body, last=True)
+        self.misses += 1
+        self.cache.set(key, (compressed, time.thread_time() - started))
+        return compressed, time.thread_time() - started, 0.0
+
+
+class CompressionResponder:
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._stream: Stream | None = None
+        self._passthrough: bool = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if self._passthrough or message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self._stream:
+            await self._send({**message, "body": self._stream.compress(body, last=not more_body)})
+            return
+
+        headers = MutableHeaders(raw=self._start["headers"])
+        if (
+                "content-encoding" in headers
+                or "no-transform" in headers.get("cache-control", "")
+                or not is_text(headers.get("content-type", ""))
+                or (not more_body and len(body) < self.middleware.minimum_size)
+        ):
+            self._passthrough = True
+            await self._send(self._start)
+            await self._send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if (etag := headers.get("etag")) and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"  # the bytes differ from the other encodings
+
+        if more_body:
+            del headers["Content-Length"]
+            self._stream = ENCODERS[self.encoding](self.middleware.levels[self.encoding])
+            await self._send(self._start)
+            await self._send({**message, "body": self._stream.compress(body, last=False)})
+            return
+
+        compressed, spent, saved = self.middleware.compress(self.encoding, body)
+        headers["Content-Length"] = str(len(compressed))
+        timing: str = f"compress;dur={spent * 1000:.2f}, compress-saved;dur={saved * 1000:.2f}"
+        headers["Server-Timing"] = f"{headers['server-timing']}, {timing}" if "server-timing" in headers else timing
+        await self._send(self._start)
+        await self._send({**message, "body": compressed})
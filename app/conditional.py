@@ -0,0 +1,124 @@
+"""
+Conditional GET: ETag / Last-Modified validators and 304 responses.
+
+The validators are made of versions that are already in memory (the registry, the locales, the templates)
+or of cheap lookups (update timestamps by primary key, the epoch of the page purges in Redis), never
+of the rendered output. The check runs before the handler, so a 304 costs no rendering and no heavy queries.
+The HTML pages depend on the viewer, so their ETag includes a digest of the access token
+and they get Last-Modified only for anonymous visitors. If-None-Match takes precedence over If-Modified-Since.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import cache, wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+from .assets import static_assets
+from .common.constants import templates_dir
+from .language.schemas import LangCode
+from .locales import locales
+from .registry import Taxonomy, registry
+from .tools import etag_matches
+from .user.auth import get_token
+
+
+@dataclass(frozen=True)
+class Validator:
+    etag: str
+    last_modified: datetime | None = None
+    private: bool = False  # depends on the viewer
+
+
+def make_etag(*parts: Any) -> str:
+    # weak, the body may be compressed in different ways
+    return f'W/"{hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).hexdigest()}"'
+
+
+@cache
+def templates_version() -> str:
+    """Changes with a deployment of new templates."""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in sorted(templates_dir.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(templates_dir).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def viewer(request: Request) -> str:
+    token: str | None = get_token(request, safe_mode=True)
+    return hashlib.blake2b(token.encode(), digest_size=8).hexdigest() if token else ""
+
+
+async def registry_validator(request: Request, ui_lang_code: LangCode | None = None, **_: Any) -> Validator:
+    """For the JSON lists and items served from the registry."""
+    taxonomy: Taxonomy = await registry.get()
+    return Validator(
+        etag=make_etag(request.url.path, request.url.query, ui_lang_code, taxonomy.version),
+        last_modified=taxonomy.loaded_at,
+    )
+
+
+async def page_validator(request: Request, *parts: Any, modified: Iterable[datetime] | None = None) -> Validator:
+    """
+    For the HTML pages, 'parts' and 'modified' describe the content of the page, the rest is common to all the pages.
+    Without 'modified' there is no Last-Modified.
+    """
+    taxonomy: Taxonomy = await registry.get()
+    viewer_digest: str = viewer(request)
+    return Validator(
+        etag=make_etag(
+            request.url.path, request.url.query, *parts,
+            taxonomy.version, locales.version, templates_version(), static_assets.version, viewer_digest,
+        ),
+        last_modified=max(*modified, taxonomy.loaded_at, locales.loaded_at)
+        if modified is not None and not viewer_digest else None,
+        private=True,
+    )
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    if (if_none_match := request.headers.get("if-none-match")) is not None:
+        return etag_matches(if_none_match, validator.etag)
+    if validator.last_modified and (if_modified_since := request.headers.get("if-modified-since")):
+        try:
+            since: datetime = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None: since = since.replace(tzinfo=timezone.utc)
+        return validator.last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def validator_headers(validator: Validator) -> Dict[str, str]:
+    # may be stored, but is revalidated every time
+    headers = {"ETag": validator.etag, "Cache-Control": "private, no-cache" if validator.private else "no-cache"}
+    if validator.last_modified:
+        headers["Last-Modified"] = format_datetime(validator.last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def conditional(get_validator: Callable[..., Awaitable[Validator | None]]) -> Any:
+    """
+    'get_validator' gets the keyword arguments of the handler, None turns the check off
+    (e.g. nothing is found, the handler gives its own answer then).
+    The handler needs 'request', and 'response' if it returns a model instead of a response.
+    """
+    def wrapper(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapped(*args: Any, **kwargs: Any) -> Any:
+            validator: Validator | None = await get_validator(**kwargs)
+            if validator is None: return await func(*args, **kwargs)
+
+            headers: Dict[str, str] = validator_headers(validator)
+            if is_not_modified(kwargs["request"], validator):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            result: Any = await func(*args, **kwargs)
+            (result if isinstance(result, Response) else kwargs["response"]).headers.update(headers)
+            return result
+        return wrapped
+    return wrapper
@@ -19,5 +19,18 @@ try:
     ADMIN_PASS: str = env.str("ADMIN_PASS")
     ADMIN_EMAIL: str = env.str("ADMIN_EMAIL")
 
+    # turn off in production, the templates are compiled once at startup then
+    TEMPLATES_AUTO_RELOAD: bool = env.bool("TEMPLATES_AUTO_RELOAD", True)
+    # compiled templates are kept here between restarts, empty - in memory only
+    TEMPLATES_CACHE_DIR: str = env.str("TEMPLATES_CACHE_DIR", "")
+
+    # see 'app/compression.py', smaller bodies are sent as they are
+    COMPRESSION_MIN_SIZE: int = env.int("COMPRESSION_MIN_SIZE", 500)
+    COMPRESSION_BR_LEVEL: int = env.int("COMPRESSION_BR_LEVEL", 4)  # 0-11
+    COMPRESSION_ZSTD_LEVEL: int = env.int("COMPRESSION_ZSTD_LEVEL", 3)  # 1-22
+    COMPRESSION_GZIP_LEVEL: int = env.int("COMPRESSION_GZIP_LEVEL", 6)  # 1-9
+    # bytes of the compressed variants kept by every process
+    COMPRESSION_CACHE_SIZE: int = env.int("COMPRESSION_CACHE_SIZE", 32 * 1024 * 1024)
+
 except Exception:
     raise
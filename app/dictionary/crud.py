@@ -0,0 +1,92 @@
+from typing import Any, Type
+from sqlalchemy import Integer, SmallInteger, String, column, func, literal, select, values
+from sqlalchemy.dialects.postgresql import insert
+from ..common.constants import WordKind
+from ..common.exceptions import DatabaseExceptions
+from ..db import Base, DBSession
+from ..dictionary.models import DictionaryModel, word_code_seq
+from ..dictionary.schemas import DictionarySchema, DictWordCode, WordSchema
+
+
+async def add_word(
+        word: DictionarySchema,
+        kind: WordKind,
+        db_session: DBSession,
+        owner: Type[Base] | None = None,
+        **owner_values: Any,
+) -> DictWordCode:
+    """
+    Adds a word (or a translation of the word with 'word.word_code') without committing.
+    A new word gets its code from 'dictionary_word_code_seq', and if 'owner' is given (TypeModel, ThemeModel, ...)
+    the owner row is inserted by the same statement. Duplicates are found by the (kind, lang_code, value) unique index.
+    """
+    word_insert = (
+        insert(DictionaryModel)
+        .values(
+            word_code=word.word_code or word_code_seq.next_value(),
+            lang_code=word.lang_code,
+            value=word.dict_value,
+            kind=kind,
+        )
+        .on_conflict_do_nothing(index_elements=[DictionaryModel.kind, DictionaryModel.lang_code, DictionaryModel.value])
+        .returning(DictionaryModel.word_code)
+    )
+
+    if word.word_code or not owner:
+        word_code: DictWordCode | None = await db_session.scalar(word_insert)
+    else:
+        # WITH new_word AS (INSERT INTO dictionary ... RETURNING word_code) INSERT INTO <owner> SELECT ... FROM new_word
+        new_word = word_insert.cte("new_word")
+        word_code = await db_session.scalar(
+            insert(owner)
+            .from_select(
+                ["word_code", *owner_values],
+                select(
+                    new_word.c.word_code,
+                    *(literal(value, getattr(owner, key).type) for key, value in owner_values.items()),
+                ),
+            )
+            .returning(owner.word_code)
+        )
+
+    if not word_code: raise DatabaseExceptions.DUPLICATED_ENTRY
+    word.word_code = word_code
+    return word_code
+
+
+async def add_translated_word(
+        word: WordSchema,
+        kind: WordKind,
+        db_session: DBSession,
+        owner: Type[Base],
+        **owner_values: Any,
+) -> int:
+    """
+    Inserts the owner row with a new word code and every translation of the word with one statement,
+    without committing. Returns the code of the owner row.
+    """
+    new_owner = (
+        insert(owner)
+        .values(word_code=word_code_seq.next_value(), **owner_values)
+        .returning(owner.code, owner.word_code)
+        .cte("new_owner")
+    )
+    translations = (
+        values(column("lang_code", Integer), column("value", String), name="translations")
+        .data([(translation.lang_code, translation.dict_value) for translation in word.translations])
+    )
+    new_words = (
+        insert(DictionaryModel)
+        .from_select(
+            ["word_code", "lang_code", "value", "kind"],
+            select(new_owner.c.word_code, translations.c.lang_code, translations.c.value, literal(kind, SmallInteger)),
+        )
+        .returning(DictionaryModel.id)
+        .cte("new_words")
+    )
+    # 'new_words' has to be referenced to be rendered, Postgres runs it anyway
+    result = await db_session.execute(
+        select(new_owner.c.code, select(func.count()).select_from(new_words).scalar_subquery())
+    )
+    code, _ = result.one()
+    return code
@@ -1,12 +1,22 @@
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, Sequence, SmallInteger, String
 from sqlalchemy.orm import Mapped, mapped_column
 from ..db import Base
 from ..common.constants import Table
 
 
+# a word and its translations share one code, so it can't be an identity of the 'dictionary' rows
+word_code_seq = Sequence("dictionary_word_code_seq", metadata=Base.metadata)
+
+
 class DictionaryModel(Base):
     __tablename__ = Table.Dictionary.table_name
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     word_code: Mapped[int] = mapped_column(Integer, index=True, nullable=False, unique=False)
     lang_code: Mapped[int] = mapped_column(Integer, ForeignKey(Table.Language.language_code), unique=False)
     value: Mapped[str] = mapped_column(String(length=256), nullable=False)
+    kind: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # WordKind
+
+    __table_args__ = (
+        Index("ix_dictionary_kind_lang_code_value", "kind", "lang_code", "value", unique=True),
+        Index("ix_dictionary_value_trgm", "value", postgresql_using="gin", postgresql_ops={"value": "gin_trgm_ops"}),
+    )
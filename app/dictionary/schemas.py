@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, List
 from pydantic import BaseModel, validator
 from ..language.schemas import LangCodeSchema
 from ..tools import remove_dup_spaces
@@ -30,3 +30,24 @@ class DictionarySchema(
     DictValueSchema
 ):
     pass
+
+
+class TranslationSchema(
+    LangCodeSchema,
+    ValidDictValueSchema,
+):
+    lang_code: int
+    dict_value: str
+
+
+class WordSchema(BaseModel):
+    """A new word with all of its translations, one per language."""
+    translations: List[TranslationSchema]
+
+    @validator("translations")
+    def check_translations(cls, value: List[TranslationSchema]) -> List[TranslationSchema]:
+        if not value or not all(translation.dict_value for translation in value):
+            raise ValueError("Every translation needs a value")
+        if len({translation.lang_code for translation in value}) != len(value):
+            raise ValueError("Only one translation per language")
+        return value
@@ -1,18 +1,26 @@
-from typing import Annotated, List
+from typing import Annotated, List, Tuple
 from fastapi import Depends
-from fastapi_cache.decorator import cache
-from sqlalchemy import ScalarResult, delete, select, update
+from sqlalchemy import delete, update
 from starlette.requests import Request
 
-from ..common.constants import DEFAULT_UI_LANGUAGE
+from ..common.constants import LANGUAGE_TAGS, UI_LANG_COOKIE
 from ..common.exceptions import CommonExceptions
 from ..common.responses import CommonResponses, ResponseSchema
 from ..db import DBSession
 from ..language.models import LanguageModel
-from ..language.schemas import LangCode, LanguageSchema
+from ..language.schemas import LangAbbr, LangCode, LanguageSchema
+from ..pages import purge_pages
+from ..registry import Taxonomy, registry
 from ..tools import db_checker
 
 
+async def reload_langs(db_session: DBSession) -> None:
+    """Every page shows the UI languages, so the pages of all the languages known before the change are purged."""
+    taxonomy: Taxonomy = await registry.get(db_session)
+    await registry.reload(db_session)
+    await purge_pages(*(f"lang:{lang.lang_code}" for lang in taxonomy.langs))
+
+
 @db_checker()
 async def add_lang(lang: LanguageSchema, db_session: DBSession) -> ResponseSchema:
     new_lang = LanguageModel(
@@ -22,6 +30,7 @@ async def add_lang(lang: LanguageSchema, db_session: DBSession) -> ResponseSchem
     )
     db_session.add(new_lang)
     await db_session.commit()
+    await reload_langs(db_session)
     return CommonResponses.CREATED
 
 
@@ -37,6 +46,7 @@ async def edit_lang(lang: LanguageSchema, db_session: DBSession) -> ResponseSche
         )
     )
     await db_session.commit()
+    await reload_langs(db_session)
     return CommonResponses.SUCCESS
 
 
@@ -47,69 +57,68 @@ async def delete_lang(lang_code: LangCode, db_session: DBSession) -> ResponseSch
         .where(LanguageModel.code == lang_code)
     )
     await db_session.commit()
+    await reload_langs(db_session)
     return CommonResponses.SUCCESS
 
 
 @db_checker()
 async def get_lang(lang_code: LangCode, db_session: DBSession) -> LanguageSchema:
-    lang_from_db: LanguageModel | None = await db_session.get(LanguageModel, lang_code)
-    if not lang_from_db: raise CommonExceptions.NOTHING_FOUND
+    taxonomy: Taxonomy = await registry.get(db_session)
+    lang: LanguageSchema | None = next((lang for lang in taxonomy.langs if lang.lang_code == lang_code), None)
+    if not lang: raise CommonExceptions.NOTHING_FOUND
     return LanguageSchema(
-        abbreviation=lang_from_db.abbreviation,
-        lang_value=lang_from_db.value,
-        is_ui_lang=lang_from_db.is_ui_lang
+        abbreviation=lang.abbreviation,
+        lang_value=lang.lang_value,
+        is_ui_lang=lang.is_ui_lang
     )
 
 
-@db_checker()
-async def ui_lang(db_session: DBSession, ui_lang_code: LangCode | None = None) -> LangCode:
-    if ui_lang_code is not None and ui_lang_code in (lang.lang_code for lang in await get_all_ui_langs(db_session)): return ui_lang_code
-    result: ScalarResult = await db_session.scalars(
-        select(LanguageModel.code).where(LanguageModel.abbreviation == DEFAULT_UI_LANGUAGE)
-    )
-    lang_code: LangCode = result.one()
-    return lang_code
+def accepted_langs(accept_language: str) -> List[LangAbbr]:
+    """Abbreviations from the Accept-Language header, the most preferred first."""
+    weighted: List[Tuple[float, LangAbbr]] = []
+    for item in accept_language.split(","):
+        tag, _, params = item.strip().partition(";")
+        primary: str = tag.split("-")[0].strip().lower()
+        try:
+            quality = float(params.strip().removeprefix("q=")) if params else 1.0
+        except ValueError:
+            continue
+        if primary and quality > 0:
+            weighted.append((quality, LANGUAGE_TAGS.get(primary, primary)))
+    return [abbr for _, abbr in sorted(weighted, key=lambda item: item[0], reverse=True)]
+
+
+async def ui_lang(request: Request, ui_lang_code: LangCode | None = None) -> LangCode:
+    """
+    The requested UI language if there is such one, otherwise the one from the cookie or Accept-Language,
+    otherwise the default. Only the registry snapshot is used, there is no I/O once it's loaded.
+    """
+    taxonomy: Taxonomy = await registry.get()
+    if ui_lang_code is not None and ui_lang_code in taxonomy.ui_lang_codes.values(): return ui_lang_code
+
+    candidates: List[LangAbbr] = [request.cookies.get(UI_LANG_COOKIE, "")]
+    if accept_language := request.headers.get("accept-language"):
+        candidates += accepted_langs(accept_language)
+    for abbr in candidates:
+        if abbr in taxonomy.ui_lang_codes: return taxonomy.ui_lang_codes[abbr]
+
+    if taxonomy.default_ui_lang_code is None: raise CommonExceptions.NOTHING_FOUND
+    return taxonomy.default_ui_lang_code
 
 UILangCode = Annotated[LangCode, Depends(ui_lang)]
 
 
 @db_checker()
-@cache(expire=3600)
 async def get_all_ui_langs(db_session: DBSession) -> List[LanguageSchema]:
-    result: ScalarResult = await db_session.scalars(
-        select(LanguageModel)
-        .where(LanguageModel.is_ui_lang == True)
-        .order_by(LanguageModel.value)
-    )
-    lang_list = []
-    for lang in result.all():
-        lang_list.append(
-            LanguageSchema(
-                lang_code=lang.code,
-                abbreviation=lang.abbreviation,
-                lang_value=lang.value,
-                is_ui_lang=lang.is_ui_lang,
-            )
-        )
+    taxonomy: Taxonomy = await registry.get(db_session)
+    lang_list = list(taxonomy.ui_langs)
     if not lang_list: raise CommonExceptions.NOTHING_FOUND
     return lang_list
 
 
 @db_checker()
 async def get_all_langs(db_session: DBSession) -> List[LanguageSchema]:
-    result: ScalarResult = await db_session.scalars(
-        select(LanguageModel)
-        .order_by(LanguageModel.value)
-    )
-    lang_list = []
-    for lang in result.all():
-        lang_list.append(
-            LanguageSchema(
-                lang_code=lang.code,
-                abbreviation=lang.abbreviation,
-                lang_value=lang.value,
-                is_ui_lang=lang.is_ui_lang
-            )
-        )
+    taxonomy: Taxonomy = await registry.get(db_session)
+    lang_list = list(taxonomy.langs)
     if not lang_list: raise CommonExceptions.NOTHING_FOUND
     return lang_list
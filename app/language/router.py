@@ -1,9 +1,11 @@
 from typing import Annotated, List
 from fastapi import APIRouter, Depends, Form, Path
 from starlette import status
+from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
 
 from ..common.responses import ResponseSchema
+from ..conditional import conditional, registry_validator
 from ..db import DBSession
 from ..language.crud import LangCode, UILangCode, add_lang, delete_lang, edit_lang, get_all_langs, get_lang
 from ..language.schemas import IsUILang, LanguageSchema, ValidLangAbbr, ValidLangValue
@@ -70,12 +72,19 @@ async def delete_language(
 
 
 @language_router.get("/{ui_lang_code}/{lang_code}", response_model_exclude_none=True)
+@conditional(registry_validator)
 @parameter_checker()
-async def get_language(lang_code: Annotated[LangCode, Path()], db_session: DBSession) -> LanguageSchema:
+async def get_language(
+        lang_code: Annotated[LangCode, Path()],
+        db_session: DBSession,
+        request: Request,
+        response: Response,
+) -> LanguageSchema:
     return await get_lang(lang_code, db_session)
 
 
 @language_router.get("/{ui_lang_code}", response_model_exclude_none=True)
+@conditional(registry_validator)
 @parameter_checker()
-async def get_all_languages(db_session: DBSession) -> List[LanguageSchema]:
+async def get_all_languages(db_session: DBSession, request: Request, response: Response) -> List[LanguageSchema]:
     return await get_all_langs(db_session)
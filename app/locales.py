@@ -0,0 +1,108 @@
+"""
+UI locale bundles, 'templates/locales/<abbreviation>' JSON files.
+
+All the bundles are read and validated once (in 'lifespan' or on the first use) into immutable mappings.
+Every bundle is merged over the default one key by key, so a missing key falls back to the default language
+and rendering never touches the filesystem. 'reload' re-reads the files whose mtime has changed,
+it's called by the admin endpoint. The version is a digest of the content, like the taxonomy one,
+'loaded_at' changes with the version. The endpoint publishes the version in Redis, the other workers
+check it together with the taxonomy one ('registry.sync_periodically') and re-read their files on a change.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping
+from redis.exceptions import RedisError
+from .common.constants import DEFAULT_UI_LANGUAGE, LOCALES_VERSION_KEY, templates_dir
+from .common.exceptions import LocaleExceptions
+from .language.schemas import LangAbbr
+from .tutorial.visits import get_redis
+
+
+logger = logging.getLogger(__name__)
+
+
+Bundle = Mapping[str, str]
+
+
+def read_bundle(path: Path) -> Dict[str, str]:
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    if isinstance(data, dict) and all(
+            (
+                isinstance(key, str) and len(key) < 256 and key.startswith("loc_") and
+                isinstance(value, str) and len(value) < 256
+            )
+            for key, value in data.items()
+    ):
+        return data
+    raise LocaleExceptions.WRONG_LOCALE
+
+
+class Locales:
+
+    def __init__(self, directory: Path, default: LangAbbr = DEFAULT_UI_LANGUAGE.lower()) -> None:
+        self.directory = directory
+        self.default = default
+        self._bundles: Mapping[LangAbbr, Bundle] = MappingProxyType({})
+        self._raw: Dict[LangAbbr, Dict[str, str]] = {}
+        self._mtimes: Dict[LangAbbr, float] = {}
+        self.version: str = ""
+        self.loaded_at: datetime = datetime.now(timezone.utc)
+        self._published: str | None = None  # the last version seen in Redis
+
+    def reload(self) -> Mapping[LangAbbr, Bundle]:
+        """
+        A broken file raises 'WRONG_LOCALE' and the bundles in use stay as they are.
+        The new bundles replace the old ones with one assignment.
+        """
+        paths: Dict[LangAbbr, Path] = {path.name: path for path in self.directory.iterdir() if path.is_file()}
+        if self.default not in paths: raise LocaleExceptions.LOCALE_NOT_FOUND
+
+        raw: Dict[LangAbbr, Dict[str, str]] = {}
+        mtimes: Dict[LangAbbr, float] = {}
+        for abbr, path in paths.items():
+            mtimes[abbr] = path.stat().st_mtime
+            raw[abbr] = self._raw[abbr] if self._mtimes.get(abbr) == mtimes[abbr] else read_bundle(path)
+
+        default: Dict[str, str] = raw[self.default]
+        self._bundles = MappingProxyType({
+            abbr: MappingProxyType({**default, **bundle}) for abbr, bundle in raw.items()
+        })
+        self._raw, self._mtimes = raw, mtimes
+        version: str = hashlib.sha256(json.dumps(raw, sort_keys=True).encode()).hexdigest()[:16]
+        if version != self.version:
+            self.version, self.loaded_at = version, datetime.now(timezone.utc)
+        return self._bundles
+
+    def sync(self, published: str | None) -> bool:
+        """Re-reads the files if another process has published a version since the last check, returns whether it did."""
+        if published is None or published == self._published: return False
+        self._published = published
+        if published == self.version: return False
+        self.reload()
+        return True
+
+    def get(self, abbr: LangAbbr) -> Bundle:
+        bundles: Mapping[LangAbbr, Bundle] = self._bundles or self.reload()
+        return bundles.get(abbr) or bundles[self.default]
+
+
+locales = Locales(templates_dir.joinpath("locales"))
+
+
+async def publish_locales() -> None:
+    try:
+        await get_redis().set(LOCALES_VERSION_KEY, locales.version)
+        locales.sync(locales.version)
+    except RedisError:
+        logger.exception("Failed to publish the locale version")
+
+
+async def sync_locales() -> bool:
+    published: bytes | None = await get_redis().get(LOCALES_VERSION_KEY)
+    return locales.sync(published.decode() if published else None)
@@ -3,7 +3,9 @@ from fastapi import FastAPI
 from .router import MainRouter
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from .compression import CompressionMiddleware
+from .config import COMPRESSION_BR_LEVEL, COMPRESSION_CACHE_SIZE, COMPRESSION_GZIP_LEVEL, COMPRESSION_MIN_SIZE, \
+    COMPRESSION_ZSTD_LEVEL
 from .startup import lifespan
 from pydantic import BaseSettings
 
@@ -17,7 +19,12 @@ app = FastAPI(title="Tutorials Project", lifespan=lifespan, openapi_url=settings
 
 app.add_middleware(HTTPSRedirectMiddleware)
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=["localhost", "10.0.2.2", "tutorials-project.onrender.com"])  # "example.com", "*.example.com"
-app.add_middleware(GZipMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=COMPRESSION_MIN_SIZE,
+    levels={"br": COMPRESSION_BR_LEVEL, "zstd": COMPRESSION_ZSTD_LEVEL, "gzip": COMPRESSION_GZIP_LEVEL},
+    cache_size=COMPRESSION_CACHE_SIZE,
+)
 MainRouter(app=app)
 
 
@@ -0,0 +1,130 @@
+"""
+Full-page cache of the HTML pages of anonymous visitors (no 'access_token' cookie).
+
+For them a page depends only on its URL and the UI language, so the final body is kept in Redis
+and a hit skips the DB and the templates. The body is kept as it is, 'CompressionMiddleware'
+negotiates the encoding and keeps the compressed variants of the same body.
+While a page is rendered, the handlers tag it with what it shows ('tag_page'):
+'tutorial:42', 'user:7', 'type:3', 'theme:5', 'dist_type:1', 'lang:1' - the UI and the tutorial languages,
+'tutorials' - the list pages, their content changes with any tutorial, 'taxonomy' - the pages with the type
+and theme lists. Every tag is a Redis set of page keys, the crud writes purge their tags after the commit.
+A purge increments the epoch, a page rendered during a purge isn't stored, so a stale page can't come back.
+The 'visited' order changes with every flush of the visits, such lists are only refreshed by the expiration.
+"""
+
+import logging
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, List, Set
+from urllib.parse import urlencode
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, WatchError
+from starlette.requests import Request
+from starlette.responses import Response
+from .common.constants import PAGE_EPOCH_KEY, PAGE_EXPIRE, PAGE_KEY, PAGE_TAG_KEY
+from .language.schemas import LangCode
+from .registry import Taxonomy, registry
+from .tools import remember_ui_lang
+from .tutorial.visits import get_redis
+from .user.auth import get_token
+
+
+logger = logging.getLogger(__name__)
+
+page_tags: ContextVar[Set[str] | None] = ContextVar("page_tags", default=None)
+
+
+def tag_page(*tags: str) -> None:
+    """Does nothing outside of a cached page."""
+    tags_of_page: Set[str] | None = page_tags.get()
+    if tags_of_page is not None: tags_of_page.update(tags)
+
+
+def page_key(request: Request, ui_lang_code: LangCode) -> str:
+    query: str = urlencode(sorted(request.query_params.multi_items()))
+    return f"{PAGE_KEY}:{ui_lang_code}:{request.url.path}?{query}"
+
+
+def tag_key(tag: str) -> str:
+    return f"{PAGE_TAG_KEY}:{tag}"
+
+
+async def ui_lang_abbr(ui_lang_code: LangCode) -> str:
+    taxonomy: Taxonomy = await registry.get()
+    return next((lang.abbreviation.lower() for lang in taxonomy.ui_langs if lang.lang_code == ui_lang_code), "")
+
+
+def cached_response(entry: Dict[bytes, bytes]) -> Response:
+    return Response(content=entry[b"body"], media_type=entry[b"media_type"].decode())
+
+
+async def store_page(key: str, response: Response, tags: Set[str], epoch: bytes | None) -> None:
+    async with get_redis().pipeline(transaction=True) as pipe:
+        await pipe.watch(PAGE_EPOCH_KEY)
+        if await pipe.get(PAGE_EPOCH_KEY) != epoch: return
+        pipe.multi()
+        pipe.hset(key, mapping={"body": response.body, "media_type": response.media_type})
+        pipe.expire(key, PAGE_EXPIRE)
+        for tag in tags:
+            pipe.sadd(tag_key(tag), key)
+            pipe.expire(tag_key(tag), PAGE_EXPIRE)
+        await pipe.execute()
+
+
+def page_cache() -> Any:
+    """For the handlers with 'request' and 'ui_lang_code', only successful GETs are stored."""
+    def wrapper(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapped(*args: Any, **kwargs: Any) -> Any:
+            request: Request = kwargs["request"]
+            if request.method != "GET" or get_token(request, safe_mode=True):
+                return await func(*args, **kwargs)
+
+            ui_lang_code: LangCode = kwargs["ui_lang_code"]
+            key: str = page_key(request, ui_lang_code)
+            redis: Redis = get_redis()
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    entry, epoch = await pipe.hgetall(key).get(PAGE_EPOCH_KEY).execute()
+            except RedisError:
+                logger.exception("Failed to read a cached page")
+                return await func(*args, **kwargs)
+
+            if entry:
+                response: Response = cached_response(entry)
+                remember_ui_lang(request, response, await ui_lang_abbr(ui_lang_code))
+                return response
+
+            token = page_tags.set({f"lang:{ui_lang_code}"})
+            try:
+                response = await func(*args, **kwargs)
+                tags: Set[str] = page_tags.get()
+            finally:
+                page_tags.reset(token)
+
+            if response.status_code == 200:
+                try:
+                    await store_page(key, response, tags, epoch)
+                except WatchError:
+                    pass
+                except RedisError:
+                    logger.exception("Failed to store a page")
+            return response
+        return wrapped
+    return wrapper
+
+
+async def page_epoch() -> int:
+    """Changes with every purge, so with every write that changes a page."""
+    return int(await get_redis().get(PAGE_EPOCH_KEY) or 0)
+
+
+async def purge_pages(*tags: str) -> None:
+    if not tags: return
+    tag_keys: List[str] = [tag_key(tag) for tag in tags]
+    try:
+        async with get_redis().pipeline(transaction=True) as pipe:
+            _, keys, _ = await pipe.incr(PAGE_EPOCH_KEY).sunion(tag_keys).delete(*tag_keys).execute()
+        if keys: await get_redis().delete(*keys)
+    except RedisError:
+        logger.exception("Failed to purge the pages tagged %s", tags)
@@ -0,0 +1,244 @@
+"""
+Reference data (languages, tutorial types, themes and distribution types) kept in memory.
+
+The registry is loaded in 'lifespan' (or by the first request that needs it) and is rebuilt
+by the add/edit/delete crud functions of these tables, so the read paths don't query the DB.
+Every rebuild makes a new immutable 'Taxonomy' and swaps it in with one assignment,
+the readers always see either the old or the new snapshot as a whole.
+The version is a digest of the content, so equal snapshots have equal versions in every worker and after restarts.
+'loaded_at' is when this process got the current version, it's never earlier than the change itself.
+The registry lives in the process: a rebuild publishes its version in Redis, every worker checks
+the published version every REGISTRY_SYNC_INTERVAL seconds ('sync_periodically') and rebuilds on a change.
+Without Redis the workers keep their snapshots until their own rebuild or restart.
+"""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, TypeVar
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy import Result, select
+from .common.constants import DEFAULT_UI_LANGUAGE, REGISTRY_SYNC_INTERVAL, REGISTRY_VERSION_KEY
+from .db import DBSession, async_session
+from .dictionary.models import DictionaryModel
+from .language.models import LanguageModel
+from .language.schemas import LangCode, LanguageSchema
+from .locales import sync_locales
+from .tutorial.dist_type.models import DistTypeModel
+from .tutorial.dist_type.schemas import DistTypeSchema
+from .tutorial.theme.models import ThemeModel
+from .tutorial.theme.schemas import ThemeSchema
+from .tutorial.type.models import TypeModel
+from .tutorial.type.schemas import TypeSchema
+from .tutorial.visits import get_redis
+
+
+logger = logging.getLogger(__name__)
+
+
+Item = TypeVar("Item", TypeSchema, ThemeSchema, DistTypeSchema)
+
+
+def by_lang(items: Iterable[Item]) -> Mapping[LangCode, Tuple[Item, ...]]:
+    """Keeps the order of 'items' inside every language."""
+    grouped: Dict[LangCode, List[Item]] = {}
+    for item in items:
+        grouped.setdefault(item.lang_code, []).append(item)
+    return MappingProxyType({lang_code: tuple(group) for lang_code, group in grouped.items()})
+
+
+def taxonomy_tree(
+        lang_code: LangCode,
+        langs: Tuple[LanguageSchema, ...],
+        types: Tuple[TypeSchema, ...],
+        themes: Tuple[ThemeSchema, ...],
+        dist_types: Tuple[DistTypeSchema, ...],
+) -> Dict[str, Any]:
+    """Types -> themes, distribution types and languages of one UI language."""
+    return {
+        "lang_code": lang_code,
+        "types": [
+            {
+                "code": tp.type_code,
+                "value": tp.dict_value,
+                "themes": [{"code": th.theme_code, "value": th.dict_value} for th in themes if th.type_code == tp.type_code],
+            }
+            for tp in types
+        ],
+        "dist_types": [{"code": dt.dist_type_code, "value": dt.dict_value} for dt in dist_types],
+        "langs": [
+            {"code": lang.lang_code, "abbreviation": lang.abbreviation, "value": lang.lang_value, "ui": lang.is_ui_lang}
+            for lang in langs
+        ],
+    }
+
+
+@dataclass(frozen=True)
+class Taxonomy:
+    version: str
+    langs: Tuple[LanguageSchema, ...]
+    ui_langs: Tuple[LanguageSchema, ...]
+    ui_lang_codes: Mapping[str, LangCode]  # by abbreviation
+    default_ui_lang_code: LangCode | None
+    types: Tuple[TypeSchema, ...]
+    themes: Tuple[ThemeSchema, ...]
+    dist_types: Tuple[DistTypeSchema, ...]
+    types_by_lang: Mapping[LangCode, Tuple[TypeSchema, ...]]
+    themes_by_lang: Mapping[LangCode, Tuple[ThemeSchema, ...]]
+    dist_types_by_lang: Mapping[LangCode, Tuple[DistTypeSchema, ...]]
+    trees: Mapping[LangCode, bytes]  # 'taxonomy_tree' as JSON
+    loaded_at: datetime
+
+    def etag(self, lang_code: LangCode) -> str:
+        return f'"{self.version}-{lang_code}"'
+
+
+async def load_taxonomy(db_session: DBSession) -> Taxonomy:
+    langs: Tuple[LanguageSchema, ...] = tuple(
+        LanguageSchema(
+            lang_code=lang.code,
+            abbreviation=lang.abbreviation,
+            lang_value=lang.value,
+            is_ui_lang=lang.is_ui_lang,
+        )
+        for lang in await db_session.scalars(select(LanguageModel).order_by(LanguageModel.value))
+    )
+
+    result: Result = await db_session.execute(
+        select(TypeModel.code, DictionaryModel.word_code, DictionaryModel.value, DictionaryModel.lang_code)
+        .where(TypeModel.word_code == DictionaryModel.word_code)
+        .order_by(DictionaryModel.value)
+    )
+    types: Tuple[TypeSchema, ...] = tuple(
+        TypeSchema(type_code=row.code, dict_value=row.value, word_code=row.word_code, lang_code=row.lang_code)
+        for row in result.all()
+    )
+
+    result = await db_session.execute(
+        select(
+            ThemeModel.code,
+            ThemeModel.type_code,
+            DictionaryModel.word_code,
+            DictionaryModel.value,
+            DictionaryModel.lang_code,
+        )
+        .where(ThemeModel.word_code == DictionaryModel.word_code)
+        .order_by(DictionaryModel.value)
+    )
+    themes: Tuple[ThemeSchema, ...] = tuple(
+        ThemeSchema(
+            theme_code=row.code,
+            type_code=row.type_code,
+            dict_value=row.value,
+            word_code=row.word_code,
+            lang_code=row.lang_code,
+        )
+        for row in result.all()
+    )
+
+    result = await db_session.execute(
+        select(DistTypeModel.code, DictionaryModel.word_code, DictionaryModel.value, DictionaryModel.lang_code)
+        .where(DistTypeModel.word_code == DictionaryModel.word_code)
+        .order_by(DictionaryModel.value)
+    )
+    dist_types: Tuple[DistTypeSchema, ...] = tuple(
+        DistTypeSchema(dist_type_code=row.code, dict_value=row.value, word_code=row.word_code, lang_code=row.lang_code)
+        for row in result.all()
+    )
+
+    types_by_lang = by_lang(types)
+    themes_by_lang = by_lang(themes)
+    dist_types_by_lang = by_lang(dist_types)
+    trees: Dict[LangCode, bytes] = {
+        lang.lang_code: orjson.dumps(taxonomy_tree(
+            lang_code=lang.lang_code,
+            langs=langs,
+            types=types_by_lang.get(lang.lang_code, ()),
+            themes=themes_by_lang.get(lang.lang_code, ()),
+            dist_types=dist_types_by_lang.get(lang.lang_code, ()),
+        ))
+        for lang in langs
+    }
+
+    return Taxonomy(
+        version=hashlib.sha256(b"".join(trees[lang.lang_code] for lang in langs)).hexdigest()[:16],
+        langs=langs,
+        ui_langs=tuple(lang for lang in langs if lang.is_ui_lang),
+        ui_lang_codes=MappingProxyType({lang.abbreviation: lang.lang_code for lang in langs if lang.is_ui_lang}),
+        default_ui_lang_code=next(
+            (lang.lang_code for lang in langs if lang.abbreviation == DEFAULT_UI_LANGUAGE), None
+        ),
+        types=types,
+        themes=themes,
+        dist_types=dist_types,
+        types_by_lang=types_by_lang,
+        themes_by_lang=themes_by_lang,
+        dist_types_by_lang=dist_types_by_lang,
+        trees=MappingProxyType(trees),
+        loaded_at=datetime.now(timezone.utc),
+    )
+
+
+class Registry:
+
+    def __init__(self) -> None:
+        self._taxonomy: Taxonomy | None = None
+        self._lock = asyncio.Lock()
+        self._published: bytes | None = None  # the last version seen in Redis
+
+    async def get(self, db_session: DBSession | None = None) -> Taxonomy:
+        if self._taxonomy: return self._taxonomy
+        async with self._lock:
+            if self._taxonomy: return self._taxonomy
+            if db_session: return await self._load(db_session)
+            async with async_session() as db_session:
+                return await self._load(db_session)
+
+    async def reload(self, db_session: DBSession) -> Taxonomy:
+        async with self._lock:
+            taxonomy: Taxonomy = await self._load(db_session)
+        try:
+            await get_redis().set(REGISTRY_VERSION_KEY, taxonomy.version)
+            self._published = taxonomy.version.encode()
+        except RedisError:
+            logger.exception("Failed to publish the taxonomy version")
+        return taxonomy
+
+    async def sync(self) -> bool:
+        """Rebuilds if another process has published a version since the last check, returns whether it did."""
+        published: bytes | None = await get_redis().get(REGISTRY_VERSION_KEY)
+        if published is None or published == self._published: return False
+        self._published = published
+        if self._taxonomy and self._taxonomy.version.encode() == published: return False
+        async with async_session() as db_session:
+            async with self._lock:
+                await self._load(db_session)
+        return True
+
+    async def _load(self, db_session: DBSession) -> Taxonomy:
+        taxonomy: Taxonomy = await load_taxonomy(db_session)
+        # the same content keeps its 'loaded_at'
+        if not self._taxonomy or self._taxonomy.version != taxonomy.version:
+            self._taxonomy = taxonomy
+        return self._taxonomy
+
+
+registry = Registry()
+
+
+async def sync_periodically(interval: float = REGISTRY_SYNC_INTERVAL) -> None:
+    """The locale version is checked in the same loop."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await registry.sync()
+        except Exception:
+            logger.exception("Failed to sync the taxonomy")
+        try:
+            await sync_locales()
+        except Exception:
+            logger.exception("Failed to sync the locales")
@@ -1,20 +1,33 @@
-import json
-from typing import Dict, List
+from itertools import chain
+from typing import Any, Dict, Iterator, List
 from starlette.requests import Request
-from app.common.constants import Credential, DEFAULT_UI_LANGUAGE, PageVars, templates, templates_dir
-from app.common.exceptions import LocaleExceptions
+from starlette.responses import Response, StreamingResponse
+from starlette.templating import Jinja2Templates
+from app.assets import static_assets
+from app.common.constants import Credential, DEFAULT_UI_LANGUAGE, STREAM_CHUNK_SIZE, PageVars, \
+    templates
 from app.db import DBSession
 from app.language.crud import UILangCode, get_all_ui_langs
 from app.language.schemas import LangAbbr, LanguageSchema
+from app.locales import Bundle, locales
+from app.pages import page_tags
+from app.tools import remember_ui_lang
 from app.user.auth import Token, decode_access_token, get_token, is_this
 from app.user.schemas import TokenDataSchema
 
+templates.env.globals["static_url"] = static_assets.url
+
 
 async def render_template(
         request: Request,
         db_session: DBSession | None = None,
         page_vars: Dict[str, ...] | None = None,
+        stream: bool = False,
 ):
+    """
+    'stream' is for the big pages, they are sent in chunks while rendering, the head of 'base.html' first.
+    A page that goes to the page cache is rendered as a whole anyway.
+    """
     context = {
         "request": request,
     }
@@ -48,29 +61,52 @@ async def render_template(
         })
         context.update(get_locale(ui_lang))
 
-    return templates.TemplateResponse(
-        name="base.html",
-        context=context,
-    )
+    if stream and page_tags.get() is None:
+        response: Response = stream_template(name="base.html", context=context)
+    else:
+        response = templates.TemplateResponse(
+            name="base.html",
+            context=context,
+        )
+    remember_ui_lang(request, response, context.get("ui_lang", "").lower())
+    return response
 
 
-def get_locale(ui_lang_abbr: LangAbbr = DEFAULT_UI_LANGUAGE.lower()) -> Dict[str, str]:
-    try:
-        a = templates_dir.joinpath("locales").joinpath(ui_lang_abbr)
-        with open(templates_dir.joinpath("locales").joinpath(ui_lang_abbr), encoding="utf-8") as file:
-            data = json.load(file)
-            if all(
-                    (
-                        isinstance(item[0], str) and len(item[0]) < 256 and item[0].startswith("loc_") and
-                        isinstance(item[1], str) and len(item[1]) < 256
-                    )
-                    for item in data.items()
-            ):
-                return data
-            raise LocaleExceptions.WRONG_LOCALE
-
-    except (FileNotFoundError, FileExistsError):
-        if ui_lang_abbr != DEFAULT_UI_LANGUAGE.lower():
-            get_locale()
-        else:
-            raise LocaleExceptions.LOCALE_NOT_FOUND
+def get_locale(ui_lang_abbr: LangAbbr = DEFAULT_UI_LANGUAGE.lower()) -> Bundle:
+    return locales.get(ui_lang_abbr)
+
+
+def precompile_templates(jinja_templates: Jinja2Templates = templates) -> int:
+    """
+    Compiles every template once, so the first requests don't pay for it and a broken template stops the startup.
+    The compiled templates stay in the environment cache (and in the bytecode cache if it's configured).
+    """
+    names: List[str] = jinja_templates.env.list_templates(extensions=["html"])
+    for name in names:
+        jinja_templates.get_template(name)
+    return len(names)
+
+
+def template_chunks(name: str, context: Dict[str, Any]) -> Iterator[str]:
+    """The head (up to '</head>') goes alone, the rest is joined into chunks of 'STREAM_CHUNK_SIZE' characters."""
+    buffer: List[str] = []
+    size: int = 0
+    is_head: bool = True
+    for part in templates.get_template(name).generate(context):
+        buffer.append(part)
+        size += len(part)
+        if size >= STREAM_CHUNK_SIZE or (is_head and "</head>" in part):
+            yield "".join(buffer)
+            buffer, size, is_head = [], 0, False
+    if buffer: yield "".join(buffer)
+
+
+def stream_template(name: str, context: Dict[str, Any]) -> StreamingResponse:
+    """
+    The first chunk is rendered before the response is returned, so the errors of the page start
+    still go to the exception handlers. The rest is rendered in the threadpool while being sent.
+    'CompressionMiddleware' negotiates the encoding and flushes every chunk, so the head still goes first.
+    """
+    chunks: Iterator[str] = template_chunks(name, context)
+    first: str = next(chunks)
+    return StreamingResponse(content=chain([first], chunks), media_type="text/html")
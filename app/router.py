@@ -1,15 +1,16 @@
 import time
-from pathlib import Path
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi_cache.decorator import cache
 from starlette import status
 from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
-from starlette.staticfiles import StaticFiles
 from ._initial_values import insert_default_data
 from .admin import admin_router
+from .api.router import api_router
+from .assets import static_assets
 from .common.constants import PageVars
 from .common.exceptions import CommonExceptions
 from .db import DBSession
@@ -47,8 +48,9 @@ class MainRouter:
         app.include_router(dist_type_router)
         app.include_router(theme_router)
         app.include_router(type_router)
+        app.include_router(api_router)
 
-        app.mount("/static", StaticFiles(directory=Path(__name__.split(".")[0]).joinpath("static")), name="static")
+        app.mount("/static", static_assets, name="static")
 
         @app.get("/")
         async def redirect(ui_lang_code: UILangCode) -> Response:
@@ -59,6 +61,9 @@ class MainRouter:
                 request: Request,
                 exc: HTTPException,
         ):
+            if request.url.path.startswith(api_router.prefix):
+                return ORJSONResponse(status_code=exc.status_code, content={"detail": exc.detail}, headers=exc.headers)
+
             page_vars = {
                 PageVars.page: PageVars.Page.exception,
                 PageVars.code: exc.status_code,
@@ -74,6 +79,12 @@ class MainRouter:
                 request: Request,
                 exc: RequestValidationError,
         ):
+            if request.url.path.startswith(api_router.prefix):
+                return ORJSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content={"detail": CommonExceptions.INVALID_PARAMETERS.detail},
+                )
+
             page_vars = {
                 PageVars.page: PageVars.Page.exception,
                 PageVars.code: status.HTTP_400_BAD_REQUEST,
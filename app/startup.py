@@ -1,9 +1,20 @@
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 from redis import asyncio as aioredis
+from app.assets import static_assets
 from app.config import REDIS_HOST, REDIS_PASS, REDIS_PORT
+from app.db import async_session, engine
+from app.locales import locales, publish_locales
+from app.registry import registry, sync_periodically
+from app.render import precompile_templates
+from app.tutorial.visits import flush_visits, flush_visits_periodically
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -15,5 +26,26 @@ async def lifespan(app: FastAPI) -> None:
         decode_responses=False,
     )
     FastAPICache.init(RedisBackend(redis), prefix="fastapi-cache")
+    async with async_session() as db_session:
+        await registry.reload(db_session)
+    locales.reload()
+    await publish_locales()
+    started = time.perf_counter()
+    compiled = precompile_templates()
+    logger.info("%s templates compiled in %.1f ms", compiled, (time.perf_counter() - started) * 1000)
+    started = time.perf_counter()
+    assets = static_assets.build()
+    logger.info("%s static files built in %.1f ms", len(assets), (time.perf_counter() - started) * 1000)
+    visits_flusher = asyncio.create_task(flush_visits_periodically())
+    registry_syncer = asyncio.create_task(sync_periodically())
     yield
+    for task in (registry_syncer, visits_flusher):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    try:
+        await flush_visits()
+    except Exception:
+        logger.exception("Failed to flush tutorial visits")
+    await engine.dispose()
     await FastAPICache.clear()
@@ -67,3 +67,27 @@ function changeTDistType(elem_id) {
     document.getElementById("t-dist-type-code").value = elem_id.replace("t-dist-type-", "");
     document.getElementById("tutor-dist-types-dropdown").classList.remove("active");
 }
+
+
+let autocompleteTimer;
+
+function autocomplete(input, ui_lang_code, list_id) {
+    clearTimeout(autocompleteTimer);
+    let prefix = input.value.trim();
+    if (prefix.length < 2) return;
+
+    autocompleteTimer = setTimeout(() => {
+        fetch("/tt/" + ui_lang_code + "/ac?q=" + encodeURIComponent(prefix))
+            .then(response => response.json())
+            .then(data => {
+                let list = document.getElementById(list_id);
+                list.innerHTML = "";
+                for (const item of data.tutorials.concat(data.types, data.themes)) {
+                    let option = document.createElement("option");
+                    option.value = item.label;
+                    list.appendChild(option);
+                }
+            })
+            .catch(() => {});
+    }, 100);
+}
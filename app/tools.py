@@ -1,8 +1,17 @@
+import base64
+import hashlib
+import json
 import re
 from functools import wraps
 from inspect import iscoroutinefunction
-from typing import Any, Callable
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from fastapi_cache.key_builder import default_key_builder
 from sqlalchemy.exc import IntegrityError, NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+from starlette.responses import Response
+from .common.constants import TRACKING_PARAMS, UI_LANG_COOKIE, UI_LANG_COOKIE_MAX_AGE
 from .common.exceptions import CommonExceptions, DatabaseExceptions
 
 
@@ -44,6 +53,60 @@ def db_checker() -> Any:
     return wrapper
 
 
+def session_free_key_builder(
+        func: Callable,
+        namespace: str = "",
+        args: Tuple = (),
+        kwargs: Dict[str, Any] | None = None,
+        **_: Any,
+) -> str:
+    """
+    The default key builder puts every argument into the key,
+    but the DB session is a new object on each request, so such a cache never hits.
+    """
+    kwargs = {key: value for key, value in (kwargs or {}).items() if not isinstance(value, AsyncSession)}
+    return default_key_builder(func, namespace, args=args, kwargs=kwargs)
+
+
+def escape_like(text: str, escape: str = "/") -> str:
+    return text.replace(escape, escape * 2).replace("%", escape + "%").replace("_", escape + "_")
+
+
+def normalize_url(url: str) -> str:
+    """
+    The same page linked in different ways gives the same string:
+    case of the scheme and host, default ports, trailing slashes, fragments and tracking parameters are ignored.
+    """
+    parts = urlsplit(url.strip())
+    scheme: str = parts.scheme.lower()
+    host: str = (parts.hostname or "").removeprefix("www.")
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    query: str = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    ))
+    # http and https usually serve the same page
+    return urlunsplit(("https" if scheme == "http" else scheme, host, parts.path.rstrip("/"), query, ""))
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses the weak comparison, so 'W/' prefixes are ignored."""
+    if not if_none_match: return False
+    if if_none_match.strip() == "*": return True
+    return etag.removeprefix("W/") in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def remember_ui_lang(request: Request, response: Response, lang_abbr: str) -> None:
+    """The cookie is used by the requests without a UI language, see 'ui_lang'."""
+    if lang_abbr and request.cookies.get(UI_LANG_COOKIE) != lang_abbr:
+        response.set_cookie(UI_LANG_COOKIE, lang_abbr, max_age=UI_LANG_COOKIE_MAX_AGE, samesite="lax")
+
+
 def remove_dup_spaces(text: str) -> str:
     return " ".join(text.split())
 
@@ -51,3 +114,18 @@ def remove_dup_spaces(text: str) -> str:
 def hard_clean_text(text: str):
     pattern = re.compile(r"[^\w]]")
     return re.sub(pattern, "", text)
+
+
+def encode_cursor(*values: Any) -> str:
+    data = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Raises ValueError (caught by the checkers) if the cursor is damaged.
+    """
+    data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    values = json.loads(data)
+    if not isinstance(values, list): raise ValueError
+    return values
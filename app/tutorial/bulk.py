@@ -0,0 +1,270 @@
+"""
+Bulk import and export of tutorials as CSV or NDJSON files.
+
+Every imported record has the fields: title, description, source_link, type, theme, language, dist_type
+(and optionally who_added_id). Type, theme, distribution type and language are given by name
+in any language, the language can also be given by its abbreviation.
+The export contains the same fields (plus codes and ids), so it can be imported back.
+
+CLI: python -m app.tutorial.bulk tutorials.csv --user-id 1
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from itertools import islice
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, TextIO, Tuple
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncResult
+from sqlalchemy.exc import DBAPIError
+from ..common.constants import EXPORT_BATCH_SIZE, IMPORT_BATCH_SIZE
+from ..db import DBSession, async_session
+from ..language.crud import get_all_langs
+from ..language.schemas import LangCode
+from ..tools import db_checker, url_hash
+from ..tutorial.dist_type.crud import get_all_dist_types
+from ..tutorial.crud import decoded_tutorial_query
+from ..tutorial.dist_type.schemas import DistTypeCode
+from ..tutorial.exceptions import TutorialExceptions
+from ..tutorial.models import TutorialModel
+from ..tutorial.schemas import ImportErrorSchema, ImportReportSchema, TutorialSchema, ValidDescriptionSchema, \
+    ValidTitleSchema
+from ..tutorial.theme.crud import get_all_themes
+from ..tutorial.theme.schemas import ThemeCode
+from ..tutorial.type.crud import get_all_types
+from ..tutorial.type.schemas import TypeCode
+from ..user.models import UserModel
+from ..user.schemas import UserID
+
+
+class BulkFormat(StrEnum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        return "text/csv" if self == BulkFormat.csv else "application/x-ndjson"
+
+    @classmethod
+    def from_filename(cls, filename: str | None) -> "BulkFormat":
+        match Path(filename or "").suffix.lower():
+            case ".csv":
+                return cls.csv
+            case ".ndjson" | ".jsonl":
+                return cls.ndjson
+            case _:
+                raise TutorialExceptions.WRONG_IMPORT_FORMAT
+
+
+@dataclass(frozen=True)
+class NameMaps:
+    types: Dict[str, TypeCode]
+    themes: Dict[Tuple[TypeCode, str], ThemeCode]
+    dist_types: Dict[str, DistTypeCode]
+    langs: Dict[str, LangCode]
+
+
+def name_key(name: Any) -> str:
+    return " ".join(str(name).split()).lower()
+
+
+async def load_name_maps(db_session: DBSession) -> NameMaps:
+    """Four queries for the whole import instead of four lookups per record."""
+    langs: Dict[str, LangCode] = {}
+    for lang in await get_all_langs(db_session=db_session):
+        langs[name_key(lang.lang_value)] = lang.lang_code
+        langs[name_key(lang.abbreviation)] = lang.lang_code
+
+    return NameMaps(
+        types={name_key(tp.dict_value): tp.type_code for tp in await get_all_types(db_session=db_session)},
+        themes={
+            (th.type_code, name_key(th.dict_value)): th.theme_code
+            for th in await get_all_themes(db_session=db_session)
+        },
+        dist_types={
+            name_key(dt.dict_value): dt.dist_type_code for dt in await get_all_dist_types(db_session=db_session)
+        },
+        langs=langs,
+    )
+
+
+def read_records(stream: TextIO, fmt: BulkFormat) -> Iterator[Tuple[int, Dict[str, Any] | str]]:
+    """Yields (line number, record), nothing is read ahead."""
+    if fmt == BulkFormat.csv:
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+    else:
+        for line_num, line in enumerate(stream, start=1):
+            if line.strip(): yield line_num, line
+
+
+def parse_record(record: Dict[str, Any] | str, maps: NameMaps, who_added_id: UserID) -> TutorialSchema:
+    if isinstance(record, str):
+        record = json.loads(record)
+        if not isinstance(record, dict): raise ValueError("a record must be a JSON object")
+
+    def resolve(names: Dict, field: str, key: Any) -> int:
+        try:
+            return names[key]
+        except KeyError:
+            raise ValueError(f"unknown {field}: {record.get(field)}")
+
+    title: str | None = ValidTitleSchema(title=record.get("title") or "").title
+    if not title: raise ValueError("title must be 2-256 characters")
+    description: str | None = ValidDescriptionSchema(description=record.get("description") or "").description
+    if not description: raise ValueError("description must be 2-1024 characters")
+
+    type_code: TypeCode = resolve(maps.types, "type", name_key(record.get("type")))
+    return TutorialSchema(
+        title=title,
+        description=description,
+        source_link=record.get("source_link"),
+        type_code=type_code,
+        theme_code=resolve(maps.themes, "theme", (type_code, name_key(record.get("theme")))),
+        lang_code=resolve(maps.langs, "language", name_key(record.get("language"))),
+        dist_type_code=resolve(maps.dist_types, "dist_type", name_key(record.get("dist_type"))),
+        who_added_id=record.get("who_added_id") or who_added_id,
+    )
+
+
+def tutorial_values(tutor: TutorialSchema) -> Dict[str, Any]:
+    return dict(
+        title=tutor.title,
+        type_code=tutor.type_code,
+        theme_code=tutor.theme_code,
+        description=tutor.description,
+        lang_code=tutor.lang_code,
+        source_link=str(tutor.source_link),
+        source_link_hash=url_hash(str(tutor.source_link)),
+        dist_type_code=tutor.dist_type_code,
+        who_added_id=tutor.who_added_id,
+    )
+
+
+async def insert_batch(
+        tutors: List[Tuple[int, TutorialSchema]],
+        report: ImportReportSchema,
+        db_session: DBSession,
+) -> Counter:
+    """Returns the number of added tutorials by user."""
+    if not tutors: return Counter()
+    try:
+        # one multi-row INSERT for the whole batch
+        await db_session.execute(insert(TutorialModel), [tutorial_values(tutor) for _, tutor in tutors])
+        await db_session.commit()
+        return Counter(tutor.who_added_id for _, tutor in tutors)
+    except DBAPIError:
+        await db_session.rollback()
+
+    # something in the batch is wrong, so this batch goes row by row to find out what exactly
+    added = Counter()
+    for line, tutor in tutors:
+        try:
+            async with db_session.begin_nested():
+                await db_session.execute(insert(TutorialModel).values(**tutorial_values(tutor)))
+            added[tutor.who_added_id] += 1
+        except DBAPIError as exc:
+            report.errors.append(ImportErrorSchema(line=line, detail=str(exc.orig)))
+    await db_session.commit()
+    return added
+
+
+@db_checker()
+async def import_tutorials(
+        stream: TextIO,
+        fmt: BulkFormat,
+        who_added_id: UserID,
+        db_session: DBSession,
+) -> ImportReportSchema:
+
+    maps: NameMaps = await load_name_maps(db_session)
+    records: Iterator = read_records(stream, fmt)
+    report = ImportReportSchema()
+    added = Counter()
+
+    # the file is read in a thread, one batch at a time
+    while batch := await run_in_threadpool(lambda: list(islice(records, IMPORT_BATCH_SIZE))):
+        tutors: List[Tuple[int, TutorialSchema]] = []
+        for line, record in batch:
+            try:
+                tutors.append((line, parse_record(record, maps, who_added_id)))
+            except (ValueError, TypeError) as exc:
+                report.errors.append(ImportErrorSchema(line=line, detail=str(exc)))
+        added.update(await insert_batch(tutors, report, db_session))
+
+    # rating goes up once per user, not once per tutorial
+    for user_id, count in added.items():
+        await db_session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(rating=UserModel.rating + count)
+        )
+    await db_session.commit()
+
+    report.imported = sum(added.values())
+    return report
+
+
+def export_row(row: Mapping[str, Any]) -> Dict[str, Any]:
+    # timestamps as ISO 8601, the same text in both formats
+    return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in row.items()}
+
+
+def encode_batch(rows: List[Mapping[str, Any]], fmt: BulkFormat, header: bool) -> bytes:
+    buffer = io.StringIO()
+    if fmt == BulkFormat.csv:
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0].keys()))
+        if header: writer.writeheader()
+        writer.writerows(map(export_row, rows))
+    else:
+        for row in rows:
+            buffer.write(json.dumps(export_row(row), ensure_ascii=False))
+            buffer.write("\n")
+    return buffer.getvalue().encode()
+
+
+async def export_tutorials(ui_lang_code: LangCode, fmt: BulkFormat) -> AsyncIterator[bytes]:
+    """
+    Reads the catalog through a server-side cursor, EXPORT_BATCH_SIZE rows at a time,
+    and encodes every batch as soon as it arrives, so memory doesn't depend on the table size.
+    It has its own session, because the response is streamed after the endpoint returns.
+    """
+    async with async_session() as db_session:
+        result: AsyncResult = await db_session.stream(
+            decoded_tutorial_query(ui_lang_code)
+            .order_by(TutorialModel.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        header_sent: bool = False
+        async for rows in result.mappings().partitions():
+            yield encode_batch(rows, fmt, header=not header_sent)
+            header_sent = True
+
+
+async def main(path: Path, who_added_id: UserID) -> None:
+    async with async_session() as db_session:
+        with open(path, encoding="utf-8-sig", newline="") as stream:
+            report: ImportReportSchema = await import_tutorials(
+                stream=stream,
+                fmt=BulkFormat.from_filename(path.name),
+                who_added_id=who_added_id,
+                db_session=db_session,
+            )
+    print(report.json(indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import of tutorials from CSV or NDJSON")
+    parser.add_argument("path", type=Path, help=".csv, .ndjson or .jsonl file")
+    parser.add_argument("--user-id", type=int, required=True, help="Who added these tutorials")
+    args = parser.parse_args()
+    asyncio.run(main(args.path, args.user_id))
@@ -1,28 +1,55 @@
-from typing import List
+from datetime import datetime
+from functools import reduce
+from typing import Any, List, Tuple
 from fastapi_cache.decorator import cache
 from pydantic import HttpUrl, parse_obj_as
-from sqlalchemy import ScalarResult, delete, func, select, update
+from redis.exceptions import RedisError
+from sqlalchemy import ColumnElement, Result, Row, Select, and_, delete, func, literal, or_, select, tuple_, \
+    union_all, update
+from sqlalchemy.dialects.postgresql import REAL
+from sqlalchemy.orm import aliased
+from starlette.datastructures import URL
 from starlette.requests import Request
 from starlette.responses import Response
-from ..common.constants import PAGINATION_OFFSET, PageVars
+from ..common.constants import AUTOCOMPLETE_EXPIRE, AUTOCOMPLETE_LIMIT, DEFAULT_SEARCH_CONFIG, PAGINATION_OFFSET, \
+    SEARCH_CONFIGS, PageDirection, PageVars
 from ..common.responses import CommonResponses, ResponseSchema
 from ..db import DBSession
-from ..language.crud import UILangCode, get_all_langs, get_lang
+from ..dictionary.models import DictionaryModel
+from ..language.crud import UILangCode, get_all_langs
+from ..language.models import LanguageModel
 from ..language.schemas import LangCode, LanguageSchema
+from ..conditional import Validator, page_validator
+from ..pages import page_epoch, purge_pages, tag_page
 from app.render import render_template
-from ..tools import db_checker, parameter_checker
-from ..tutorial.dist_type.crud import get_all_dist_types, get_dist_type
+from ..tools import db_checker, decode_cursor, encode_cursor, escape_like, parameter_checker, \
+    session_free_key_builder, url_hash
+from ..tutorial.dist_type.crud import get_all_dist_types
+from ..tutorial.dist_type.models import DistTypeModel
 from ..tutorial.dist_type.schemas import DistTypeCode, DistTypeSchema
 from ..tutorial.exceptions import TutorialExceptions
-from ..tutorial.models import TutorialModel
-from ..tutorial.schemas import DecodedTutorialSchema, Pagination, TutorialID, TutorialListSchema, TutorialSchema
-from ..tutorial.theme.crud import get_all_themes, get_theme
+from ..tutorial.fragments import invalidate_cards, tutorial_cards
+from ..tutorial.models import TutorialModel, TutorialVisitsModel
+from ..tutorial.schemas import AutocompleteSchema, Cursor, DecodedTutorialSchema, Pagination, SearchQuery, \
+    SuggestionSchema, TutorialID, TutorialListSchema, TutorialSchema, TutorialSort
+from ..tutorial.theme.crud import get_all_themes
+from ..tutorial.theme.models import ThemeModel
 from ..tutorial.theme.schemas import ThemeCode, ThemeSchema
-from ..tutorial.type.crud import get_all_types, get_type
+from ..tutorial.type.crud import get_all_types
+from ..tutorial.type.models import TypeModel
 from ..tutorial.type.schemas import TypeCode, TypeSchema
-from ..user.crud import get_user
+from ..tutorial.visits import forget_link
 from ..user.models import UserModel
-from ..user.schemas import UserSchema
+
+
+async def check_duplicate_link(source_link: str, db_session: DBSession, tutor_id: TutorialID | None = None) -> str:
+    """Returns the hash of the link, one lookup in the 'source_link_hash' unique index."""
+    link_hash: str = url_hash(source_link)
+    query: Select = select(TutorialModel.id).where(TutorialModel.source_link_hash == link_hash)
+    if tutor_id:
+        query = query.where(TutorialModel.id != tutor_id)
+    if await db_session.scalar(query.limit(1)): raise TutorialExceptions.DUPLICATED_LINK
+    return link_hash
 
 
 @db_checker()
@@ -34,6 +61,7 @@ async def add_tutorial(tutor: TutorialSchema, db_session: DBSession) -> Tutorial
         description=tutor.description,
         lang_code=tutor.lang_code,
         source_link=str(tutor.source_link),
+        source_link_hash=await check_duplicate_link(str(tutor.source_link), db_session),
         dist_type_code=tutor.dist_type_code,
         who_added_id=tutor.who_added_id
     )
@@ -45,6 +73,7 @@ async def add_tutorial(tutor: TutorialSchema, db_session: DBSession) -> Tutorial
         .values(rating=UserModel.rating + 1)
     )
     await db_session.commit()
+    await purge_pages("tutorials", f"user:{tutor.who_added_id}")
     return new_tutor.id
 
 
@@ -60,10 +89,14 @@ async def edit_tutorial(tutor: TutorialSchema, db_session: DBSession) -> Respons
             lang_code=tutor.lang_code,
             description=tutor.description,
             dist_type_code=tutor.dist_type_code,
-            source_link=tutor.source_link
+            source_link=tutor.source_link,
+            source_link_hash=await check_duplicate_link(str(tutor.source_link), db_session, tutor.id),
         )
     )
     await db_session.commit()
+    await invalidate_cards(tutor.id)
+    await forget_link(tutor.id)
+    await purge_pages("tutorials", f"tutorial:{tutor.id}")
     return CommonResponses.SUCCESS
 
 
@@ -79,9 +112,81 @@ async def delete_tutorial(tutor_id: TutorialID, db_session: DBSession) -> Respon
         .values(rating=UserModel.rating - 1)
     )
     await db_session.commit()
+    await invalidate_cards(tutor_id)
+    await forget_link(tutor_id)
+    await purge_pages("tutorials", f"tutorial:{tutor_id}")
     return CommonResponses.SUCCESS
 
 
+def decoded_tutorial_query(ui_lang_code: LangCode) -> Select:
+    """
+    One statement that returns tutorials together with all the values
+    needed by 'DecodedTutorialSchema' in the requested UI language.
+    """
+    type_word = aliased(DictionaryModel)
+    theme_word = aliased(DictionaryModel)
+    dist_type_word = aliased(DictionaryModel)
+
+    return (
+        select(
+            TutorialModel.id,
+            TutorialModel.title,
+            TutorialModel.type_code,
+            type_word.value.label("type"),
+            TutorialModel.theme_code,
+            theme_word.value.label("theme"),
+            TutorialModel.lang_code,
+            LanguageModel.value.label("language"),
+            TutorialModel.description,
+            TutorialModel.dist_type_code,
+            dist_type_word.value.label("dist_type"),
+            TutorialModel.source_link,
+            TutorialModel.who_added_id,
+            UserModel.name.label("who_added"),
+            UserModel.is_active.label("who_added_is_active"),
+            TutorialModel.updated_at,
+        )
+        .join(LanguageModel, LanguageModel.code == TutorialModel.lang_code)
+        .join(UserModel, UserModel.id == TutorialModel.who_added_id)
+        .join(TypeModel, TypeModel.code == TutorialModel.type_code)
+        .join(type_word, and_(
+            type_word.word_code == TypeModel.word_code,
+            type_word.lang_code == ui_lang_code,
+        ))
+        .join(ThemeModel, ThemeModel.code == TutorialModel.theme_code)
+        .join(theme_word, and_(
+            theme_word.word_code == ThemeModel.word_code,
+            theme_word.lang_code == ui_lang_code,
+        ))
+        .join(DistTypeModel, DistTypeModel.code == TutorialModel.dist_type_code)
+        .join(dist_type_word, and_(
+            dist_type_word.word_code == DistTypeModel.word_code,
+            dist_type_word.lang_code == ui_lang_code,
+        ))
+    )
+
+
+def decode_tutorial(row: Row, short: bool = False) -> DecodedTutorialSchema:
+    return DecodedTutorialSchema(
+        id=row.id,
+        title=row.title,
+        type_code=row.type_code,
+        type=row.type,
+        theme_code=row.theme_code,
+        theme=row.theme,
+        lang_code=row.lang_code,
+        language=row.language,
+        description=row.description[:256] + "..." if short else row.description,
+        dist_type_code=row.dist_type_code,
+        dist_type=row.dist_type,
+        source_link=parse_obj_as(HttpUrl, row.source_link),
+        who_added_id=row.who_added_id,
+        who_added=row.who_added,
+        who_added_is_active=row.who_added_is_active,
+        updated_at=row.updated_at,
+    )
+
+
 @db_checker()
 async def get_tutorial(
         tutor_id: TutorialID,
@@ -89,50 +194,139 @@ async def get_tutorial(
         db_session: DBSession
 ) -> DecodedTutorialSchema:
 
-    tutor: TutorialSchema | None = await db_session.get(TutorialModel, tutor_id)
+    result: Result = await db_session.execute(
+        decoded_tutorial_query(ui_lang_code)
+        .where(TutorialModel.id == tutor_id)
+    )
+    tutor: Row | None = result.one_or_none()
     if not tutor: raise TutorialExceptions.TUTORIAL_NOT_FOUND
+    return decode_tutorial(tutor)
 
-    decoded_lang: LanguageSchema = await get_lang(
-        lang_code=tutor.lang_code,
-        db_session=db_session
-    )
-    decoded_user: UserSchema = await get_user(
-        user_id=tutor.who_added_id,
-        db_session=db_session,
-        safe_mode=True,
+
+@db_checker()
+async def get_source_link(tutor_id: TutorialID, db_session: DBSession) -> str:
+    source_link: str | None = await db_session.scalar(
+        select(TutorialModel.source_link)
+        .where(TutorialModel.id == tutor_id)
     )
-    decoded_type: TypeSchema = await get_type(
-        type_code=tutor.type_code,
-        ui_lang_code=ui_lang_code,
-        db_session=db_session
+    if not source_link: raise TutorialExceptions.TUTORIAL_NOT_FOUND
+    return source_link
+
+
+async def tutorial_validator(
+        request: Request,
+        ui_lang_code: LangCode,
+        tutor_id: TutorialID,
+        db_session: DBSession,
+        **_: Any,
+) -> Validator | None:
+    """The page shows the tutorial and the name and status of its author."""
+    result: Result = await db_session.execute(
+        select(TutorialModel.updated_at, UserModel.updated_at.label("who_added_updated_at"))
+        .join(UserModel, UserModel.id == TutorialModel.who_added_id)
+        .where(TutorialModel.id == tutor_id)
     )
-    decoded_theme: ThemeSchema = await get_theme(
-        theme_code=tutor.theme_code,
-        ui_lang_code=ui_lang_code,
-        db_session=db_session
+    row: Row | None = result.one_or_none()
+    if not row: return None
+    return await page_validator(
+        request, ui_lang_code, row.updated_at, row.who_added_updated_at,
+        modified=(row.updated_at, row.who_added_updated_at),
     )
-    decoded_dist_type: DistTypeSchema = await get_dist_type(
-        dist_type_code=tutor.dist_type_code,
-        ui_lang_code=ui_lang_code,
-        db_session=db_session
+
+
+async def tutorials_validator(
+        request: Request,
+        ui_lang_code: LangCode,
+        sort: TutorialSort | None = None,
+        **_: Any,
+) -> Validator | None:
+    """
+    Any write can change a list, so the lists are versioned by the purge epoch.
+    The 'visited' order changes with every flush of the visits, it goes without validators.
+    """
+    if sort == TutorialSort.visited: return None
+    try:
+        epoch: int = await page_epoch()
+    except RedisError:
+        return None
+    return await page_validator(request, ui_lang_code, epoch)
+
+
+def cursor_value(key: ColumnElement, value: Any) -> Any:
+    python_type: type = key.type.python_type
+    return python_type.fromisoformat(value) if python_type is datetime else python_type(value)
+
+
+def tutorial_sort_keys(sort: TutorialSort | None) -> Tuple[List[ColumnElement], bool]:
+    """Returns the sort keys and whether they are descending, every order has an index."""
+    match sort:
+        case TutorialSort.newest:
+            return [TutorialModel.created_at, TutorialModel.id], True
+        case TutorialSort.updated:
+            return [TutorialModel.updated_at, TutorialModel.id], True
+        case TutorialSort.rating:
+            # user (rating, id) -> tutorial (who_added_id, id), no sort of the whole table
+            return [UserModel.rating, TutorialModel.who_added_id, TutorialModel.id], True
+        case TutorialSort.title:
+            # by language first, the titles of different scripts don't mix on one page
+            return [TutorialModel.lang_code, TutorialModel.title, TutorialModel.id], False
+        case TutorialSort.visited:
+            return [TutorialVisitsModel.visits, TutorialVisitsModel.tutorial_id], True
+        case _:
+            return [TutorialModel.id], False
+
+
+async def paginate_tutorials(
+        query: Select,
+        db_session: DBSession,
+        sort_keys: List[ColumnElement],
+        page: Pagination = 1,
+        cursor: Cursor | None = None,
+        descending: bool = False,
+) -> TutorialListSchema:
+    """
+    Keyset pagination over 'sort_keys', the last key has to be unique ('tutorial.id').
+    The cursor keeps the direction, the page number (just for display) and the boundary keys.
+    'page' without a cursor is still accepted, it falls back to OFFSET.
+    """
+
+    backward: bool = False
+    if cursor:
+        direction, page, *boundary = decode_cursor(cursor)
+        if len(boundary) != len(sort_keys): raise ValueError
+        page = int(page)
+        backward = PageDirection(direction) == PageDirection.prev
+        keys: ColumnElement = tuple_(*sort_keys)
+        values: ColumnElement = tuple_(*(cursor_value(key, value) for key, value in zip(sort_keys, boundary)))
+        query = query.where(keys < values if descending != backward else keys > values)
+    elif page > 1:
+        query = query.offset((page - 1) * PAGINATION_OFFSET)
+
+    # one extra row tells whether there is one more page in this direction
+    result: Result = await db_session.execute(
+        query
+        .add_columns(*(key.label(f"sort_key_{i}") for i, key in enumerate(sort_keys)))
+        .order_by(*(key.desc() if descending != backward else key for key in sort_keys))
+        .limit(PAGINATION_OFFSET + 1)
     )
+    rows: List[Row] = result.all()
+    is_more: bool = len(rows) > PAGINATION_OFFSET
+    rows = rows[:PAGINATION_OFFSET]
+    if backward: rows.reverse()
 
-    return DecodedTutorialSchema(
-        id=tutor.id,
-        title=tutor.title,
-        type_code=tutor.type_code,
-        type=decoded_type.dict_value,
-        theme_code=tutor.theme_code,
-        theme=decoded_theme.dict_value,
-        lang_code=tutor.lang_code,
-        language=decoded_lang.lang_value,
-        description=tutor.description,
-        dist_type_code=tutor.dist_type_code,
-        dist_type=decoded_dist_type.dict_value,
-        source_link=parse_obj_as(HttpUrl, tutor.source_link),
-        who_added_id=tutor.who_added_id,
-        who_added=decoded_user.name,
-        who_added_is_active=decoded_user.is_active,
+    is_next_page: bool = True if backward else is_more
+    is_prev_page: bool = is_more if backward else page > 1
+
+    def boundary_of(row: Row) -> List:
+        return [getattr(row, f"sort_key_{i}") for i in range(len(sort_keys))]
+
+    return TutorialListSchema(
+        tutorials=[decode_tutorial(row, short=True) for row in rows],
+        page=page,
+        next_cursor=encode_cursor(PageDirection.next, page + 1, *boundary_of(rows[-1]))
+        if rows and is_next_page else None,
+        prev_cursor=encode_cursor(PageDirection.prev, page - 1, *boundary_of(rows[0]))
+        if rows and is_prev_page else None,
     )
 
 
@@ -141,95 +335,141 @@ async def get_tutorial(
 async def get_all_tutorials(
         ui_lang_code: LangCode,
         db_session: DBSession,
-        page: Pagination,
+        page: Pagination = 1,
+        cursor: Cursor | None = None,
         type_code: TypeCode | None = None,
         theme_code: ThemeCode | None = None,
         dist_type_code: DistTypeCode | None = None,
         tutor_lang_code: LangCode | None = None,
+        sort: TutorialSort | None = None,
 ) -> TutorialListSchema:
 
-    result: ScalarResult = await db_session.execute(select(func.count(TutorialModel.id)))
-    total_tutors: int = result.first()[0]
+    query: Select = decoded_tutorial_query(ui_lang_code)
 
+    # all the filters are combined, every combination is paginated the same way
     if type_code:
-        result: ScalarResult = await db_session.scalars(
-            select(TutorialModel)
-            .where(TutorialModel.type_code == type_code)
-        )
-    elif theme_code:
-        result: ScalarResult = await db_session.scalars(
-            select(TutorialModel)
-            .where(TutorialModel.theme_code == theme_code)
-        )
-    elif dist_type_code:
-        result: ScalarResult = await db_session.scalars(
-            select(TutorialModel)
-            .where(TutorialModel.dist_type_code == dist_type_code)
-        )
-    elif tutor_lang_code:
-        result: ScalarResult = await db_session.scalars(
-            select(TutorialModel)
-            .where(TutorialModel.lang_code == tutor_lang_code)
-        )
-    else:
-        result: ScalarResult = await db_session.scalars(
-            select(TutorialModel)
-            .offset((page - 1) * PAGINATION_OFFSET)
-            .fetch(PAGINATION_OFFSET)
-        )
+        query = query.where(TutorialModel.type_code == type_code)
+    if theme_code:
+        query = query.where(TutorialModel.theme_code == theme_code)
+    if dist_type_code:
+        query = query.where(TutorialModel.dist_type_code == dist_type_code)
+    if tutor_lang_code:
+        query = query.where(TutorialModel.lang_code == tutor_lang_code)
 
-    tutors_list: List[DecodedTutorialSchema] = []
+    if sort == TutorialSort.visited:
+        # only tutorials that have been visited at least once
+        query = query.join(TutorialVisitsModel, TutorialVisitsModel.tutorial_id == TutorialModel.id)
 
-    for tutor in result:
-        decoded_lang: LanguageSchema = await get_lang(
-            lang_code=tutor.lang_code,
-            db_session=db_session
-        )
-        decoded_user: UserSchema = await get_user(
-            user_id=tutor.who_added_id,
-            db_session=db_session,
-            safe_mode=True,
-        )
-        decoded_type: TypeSchema = await get_type(
-            type_code=tutor.type_code,
-            ui_lang_code=ui_lang_code,
-            db_session=db_session
-        )
-        decoded_theme: ThemeSchema = await get_theme(
-            theme_code=tutor.theme_code,
-            ui_lang_code=ui_lang_code,
-            db_session=db_session
-        )
-        decoded_dist_type: DistTypeSchema = await get_dist_type(
-            dist_type_code=tutor.dist_type_code,
-            ui_lang_code=ui_lang_code,
-            db_session=db_session
+    sort_keys, descending = tutorial_sort_keys(sort)
+    return await paginate_tutorials(
+        query=query,
+        db_session=db_session,
+        sort_keys=sort_keys,
+        page=page,
+        cursor=cursor,
+        descending=descending,
+    )
+
+
+@db_checker()
+async def search_tutorials(
+        search_query: SearchQuery,
+        ui_lang_code: LangCode,
+        db_session: DBSession,
+        page: Pagination = 1,
+        cursor: Cursor | None = None,
+) -> TutorialListSchema:
+    """
+    The language of the query is unknown, so it is parsed with every text search config
+    and the results are joined with OR. It is still one constant 'tsquery', so the GIN index is used.
+    """
+
+    ts_query: ColumnElement = reduce(
+        lambda left, right: left.op("||")(right),
+        (
+            func.websearch_to_tsquery(config, search_query)
+            for config in sorted({*SEARCH_CONFIGS.values(), DEFAULT_SEARCH_CONFIG})
+        ),
+    )
+    rank: ColumnElement = func.ts_rank_cd(TutorialModel.search_vector, ts_query, type_=REAL)
+
+    query: Select = (
+        decoded_tutorial_query(ui_lang_code)
+        .where(TutorialModel.search_vector.op("@@")(ts_query))
+    )
+
+    return await paginate_tutorials(
+        query=query,
+        db_session=db_session,
+        sort_keys=[rank, TutorialModel.id],
+        page=page,
+        cursor=cursor,
+        descending=True,
+    )
+
+
+@db_checker()
+@cache(expire=AUTOCOMPLETE_EXPIRE, key_builder=session_free_key_builder)  # by the normalized prefix
+async def autocomplete(prefix: SearchQuery, ui_lang_code: LangCode, db_session: DBSession) -> AutocompleteSchema:
+    """
+    Prefix (ILIKE) and typo-tolerant (pg_trgm word similarity) matches over tutorial titles
+    and type / theme names. Both operators are served by the trigram GIN indexes.
+    All three lists are read in one round trip.
+    """
+
+    pattern: str = escape_like(prefix) + "%"
+
+    def suggestions(query: Select, label: ColumnElement) -> Select:
+        is_prefix: ColumnElement = label.ilike(pattern, escape="/")
+        return (
+            query
+            .where(or_(is_prefix, literal(prefix).op("<%")(label)))
+            .order_by(is_prefix.desc(), func.word_similarity(prefix, label).desc(), label)
+            .limit(AUTOCOMPLETE_LIMIT)
         )
 
-        tutors_list.append(
-            DecodedTutorialSchema(
-                id=tutor.id,
-                title=tutor.title,
-                type_code=tutor.type_code,
-                type=decoded_type.dict_value,
-                theme_code=tutor.theme_code,
-                theme=decoded_theme.dict_value,
-                lang_code=tutor.lang_code,
-                language=decoded_lang.lang_value,
-                description=tutor.description[:256] + "...",
-                dist_type_code=tutor.dist_type_code,
-                dist_type=decoded_dist_type.dict_value,
-                source_link=parse_obj_as(HttpUrl, tutor.source_link),
-                who_added_id=tutor.who_added_id,
-                who_added=decoded_user.name,
-                who_added_is_active=decoded_user.is_active,
-            )
+    result: Result = await db_session.execute(
+        union_all(
+            suggestions(
+                select(
+                    literal("tutorials").label("kind"),
+                    TutorialModel.id.label("id"),
+                    TutorialModel.title.label("label"),
+                ),
+                TutorialModel.title,
+            ),
+            suggestions(
+                select(
+                    literal("types").label("kind"),
+                    TypeModel.code.label("id"),
+                    DictionaryModel.value.label("label"),
+                )
+                .join(DictionaryModel, and_(
+                    DictionaryModel.word_code == TypeModel.word_code,
+                    DictionaryModel.lang_code == ui_lang_code,
+                )),
+                DictionaryModel.value,
+            ),
+            suggestions(
+                select(
+                    literal("themes").label("kind"),
+                    ThemeModel.code.label("id"),
+                    DictionaryModel.value.label("label"),
+                )
+                .join(DictionaryModel, and_(
+                    DictionaryModel.word_code == ThemeModel.word_code,
+                    DictionaryModel.lang_code == ui_lang_code,
+                )),
+                DictionaryModel.value,
+            ),
         )
-    return TutorialListSchema(
-        tutorials=tutors_list,
-        total_count=total_tutors,
     )
 
+    found = AutocompleteSchema()
+    for row in result.all():
+        getattr(found, row.kind).append(SuggestionSchema(id=row.id, label=row.label))
+    return found
+
 
 @parameter_checker()
 async def tutorial_page(
@@ -275,3 +515,59 @@ async def tutorial_page(
         db_session=db_session,
         page_vars=page_vars,
     )
+
+
+@parameter_checker()
+async def tutorials_page(
+        tutors_list: TutorialListSchema,
+        ui_lang_code: UILangCode,
+        request: Request,
+        db_session: DBSession,
+        search_query: SearchQuery | None = None,
+        sort: TutorialSort | None = None,
+) -> Response:
+
+    tutor_types: List[TypeSchema] = await get_all_types(
+        ui_lang_code=ui_lang_code,
+        db_session=db_session,
+    )
+    tutor_themes: List[ThemeSchema] = await get_all_themes(
+        ui_lang_code=ui_lang_code,
+        db_session=db_session,
+    )
+    tag_page("tutorials", "taxonomy")
+    for tutor in tutors_list.tutorials:
+        tag_page(f"tutorial:{tutor.id}", f"user:{tutor.who_added_id}", f"lang:{tutor.lang_code}")
+
+    page_vars = {
+        PageVars.page: PageVars.Page.main,
+        PageVars.ui_lang_code: ui_lang_code,
+        "tutor_cards": await tutorial_cards(tutors_list.tutorials, ui_lang_code),
+        "tutor_types": tutor_types,
+        "tutor_themes": tutor_themes,
+        "search_query": search_query,
+        "current_page": tutors_list.page,
+        "next_page_url": page_url(request, tutors_list.next_cursor),
+        "prev_page_url": page_url(request, tutors_list.prev_cursor),
+        "sort": sort,
+        "sort_urls": None if search_query else {option: sort_url(request, option) for option in TutorialSort},
+    }
+    return await render_template(
+        request=request,
+        db_session=db_session,
+        page_vars=page_vars,
+        stream=True,
+    )
+
+
+def page_url(request: Request, cursor: Cursor | None) -> str | None:
+    """Keeps the current filters, replaces the old 'page' with the cursor."""
+    if not cursor: return None
+    url: URL = request.url.remove_query_params("page").include_query_params(cursor=cursor)
+    return f"{url.path}?{url.query}"
+
+
+def sort_url(request: Request, sort: TutorialSort) -> str:
+    """Keeps the current filters, a new order starts from the first page."""
+    url: URL = request.url.remove_query_params(["page", "cursor"]).include_query_params(sort=sort)
+    return f"{url.path}?{url.query}"
@@ -1,14 +1,16 @@
 from typing import Annotated, List
 from fastapi import APIRouter, Depends, Form, Path
 from starlette import status
+from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
+from ...conditional import conditional, registry_validator
 from ...db import DBSession
-from ...dictionary.schemas import DictWordCode, DictionarySchema, ValidDictValue
+from ...dictionary.schemas import DictWordCode, DictionarySchema, ValidDictValue, WordSchema
 from ...language.schemas import LangCode
 from ...tools import parameter_checker
-from ...tutorial.dist_type.crud import add_dist_type, delete_dist_type, edit_dist_type, get_all_dist_types, \
-    get_dist_type
-from ...tutorial.dist_type.schemas import DistTypeCode, DistTypeSchema
+from ...tutorial.dist_type.crud import add_dist_type, add_dist_type_word, delete_dist_type, edit_dist_type, \
+    get_all_dist_types, get_dist_type
+from ...tutorial.dist_type.schemas import DistTypeCode, DistTypeCodeSchema, DistTypeSchema
 from ...user.auth import is_admin
 
 
@@ -36,6 +38,24 @@ async def add_distribution_type(
         return RedirectResponse(url=f"/adm/{ui_lang_code}", status_code=status.HTTP_302_FOUND)
 
 
+@dist_type_router.post(
+    "/{ui_lang_code}/add-word", status_code=status.HTTP_201_CREATED, dependencies=[Depends(is_admin)]
+)
+@parameter_checker()
+async def add_distribution_type_word(
+        word: WordSchema,
+        ui_lang_code: Annotated[LangCode, Path()],
+        db_session: DBSession,
+) -> DistTypeCodeSchema:
+
+    return DistTypeCodeSchema(
+        dist_type_code=await add_dist_type_word(
+            word=word,
+            db_session=db_session,
+        )
+    )
+
+
 @dist_type_router.post("/{ui_lang_code}/{dist_type_code}/edit", dependencies=[Depends(is_admin)])
 @parameter_checker()
 async def edit_distribution_type(
@@ -73,11 +93,14 @@ async def delete_distribution_type(
 
 
 @dist_type_router.get("/{ui_lang_code}/{dist_type_code}", response_model_exclude_none=True)
+@conditional(registry_validator)
 @parameter_checker()
 async def get_distribution_type(
         dist_type_code: Annotated[DistTypeCode, Path()],
         ui_lang_code: Annotated[LangCode, Path()],
         db_session: DBSession,
+        request: Request,
+        response: Response,
 ) -> DistTypeSchema:
 
     return await get_dist_type(
@@ -88,10 +111,13 @@ async def get_distribution_type(
 
 
 @dist_type_router.get("/{ui_lang_code}", response_model_exclude_none=True)
+@conditional(registry_validator)
 @parameter_checker()
 async def get_all_distribution_types(
         ui_lang_code: Annotated[LangCode, Path()],
         db_session: DBSession,
+        request: Request,
+        response: Response,
 ) -> List[DistTypeSchema]:
 
     return await get_all_dist_types(
@@ -9,3 +9,13 @@ class TutorialExceptions(BaseException):
         status_code=status.HTTP_404_NOT_FOUND,
         detail="Tutorial not found",
     )
+
+    DUPLICATED_LINK = HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="There is already a tutorial with the same link",
+    )
+
+    WRONG_IMPORT_FORMAT = HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Only .csv and .ndjson (.jsonl) files can be imported",
+    )
@@ -0,0 +1,127 @@
+"""
+Rendered tutorial cards ('tutorial.html') of the list pages.
+
+A card is kept by (tutor_id, ui_lang_code, version) in an in-process LRU and in Redis,
+one hash per tutorial with '{ui_lang_code}:{version}' fields. The version is a digest of everything
+the card shows: the update time of the tutorial, its author, the taxonomy and the locale versions.
+So a taxonomy rename or a locale reload moves all the cards to new keys, the old ones drop out
+of the LRU and expire in Redis. 'edit_tutorial' and 'delete_tutorial' drop the cards of the tutorial,
+the other processes don't meet the old version anymore, the edit changes 'updated_at'.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import List, Tuple
+from markupsafe import Markup
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from ..common.constants import DEFAULT_UI_LANGUAGE, FRAGMENT_CACHE_SIZE, FRAGMENT_EXPIRE, FRAGMENT_KEY, templates
+from ..language.schemas import LangAbbr, LangCode
+from ..locales import Bundle, locales
+from ..registry import Taxonomy, registry
+from ..tutorial.schemas import DecodedTutorialSchema, TutorialID
+from ..tutorial.visits import get_redis
+
+
+logger = logging.getLogger(__name__)
+
+CardKey = Tuple[TutorialID, LangCode, str]
+
+
+class FragmentCache:
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._fragments: OrderedDict[CardKey, Markup] = OrderedDict()
+
+    def get(self, key: CardKey) -> Markup | None:
+        fragment: Markup | None = self._fragments.get(key)
+        if fragment is not None: self._fragments.move_to_end(key)
+        return fragment
+
+    def set(self, key: CardKey, fragment: Markup) -> None:
+        self._fragments[key] = fragment
+        self._fragments.move_to_end(key)
+        while len(self._fragments) > self.size:
+            self._fragments.popitem(last=False)
+
+    def invalidate(self, tutor_id: TutorialID) -> None:
+        for key in [key for key in self._fragments if key[0] == tutor_id]:
+            del self._fragments[key]
+
+
+cards = FragmentCache(FRAGMENT_CACHE_SIZE)
+
+
+def card_version(tutor: DecodedTutorialSchema, taxonomy_version: str, locale_version: str) -> str:
+    source: str = "|".join(map(str, (
+        tutor.updated_at, tutor.who_added, tutor.who_added_is_active, taxonomy_version, locale_version,
+    )))
+    return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+
+
+def redis_key(tutor_id: TutorialID) -> str:
+    return f"{FRAGMENT_KEY}:{tutor_id}"
+
+
+def render_card(tutor: DecodedTutorialSchema, ui_lang_code: LangCode, locale: Bundle) -> Markup:
+    return Markup(templates.get_template("tutorial.html").render(tutor=tutor, ui_lang_code=ui_lang_code, **locale))
+
+
+async def tutorial_cards(tutors: List[DecodedTutorialSchema], ui_lang_code: LangCode) -> List[Markup]:
+    """
+    Cards are looked up in the LRU, then the missing ones in Redis with one round trip,
+    the rest are rendered and stored in both. Redis errors only cost a render.
+    """
+    taxonomy: Taxonomy = await registry.get()
+    ui_lang_abbr: LangAbbr = next(
+        (lang.abbreviation for lang in taxonomy.ui_langs if lang.lang_code == ui_lang_code),
+        DEFAULT_UI_LANGUAGE,
+    )
+    locale: Bundle = locales.get(ui_lang_abbr.lower())
+
+    keys: List[CardKey] = [
+        (tutor.id, ui_lang_code, card_version(tutor, taxonomy.version, locales.version)) for tutor in tutors
+    ]
+    found: List[Markup | None] = [cards.get(key) for key in keys]
+    missing: List[int] = [i for i, fragment in enumerate(found) if fragment is None]
+    if not missing: return found
+
+    redis: Redis = get_redis()
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for i in missing:
+                pipe.hget(redis_key(keys[i][0]), f"{ui_lang_code}:{keys[i][2]}")
+            stored: List[bytes | None] = await pipe.execute()
+    except RedisError:
+        logger.exception("Failed to read tutorial cards")
+        stored = [None] * len(missing)
+
+    rendered: List[int] = []
+    for i, fragment in zip(missing, stored):
+        if fragment is None:
+            found[i] = render_card(tutors[i], ui_lang_code, locale)
+            rendered.append(i)
+        else:
+            found[i] = Markup(fragment.decode())
+        cards.set(keys[i], found[i])
+
+    if rendered:
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for i in rendered:
+                    pipe.hset(redis_key(keys[i][0]), f"{ui_lang_code}:{keys[i][2]}", str(found[i]))
+                    pipe.expire(redis_key(keys[i][0]), FRAGMENT_EXPIRE)
+                await pipe.execute()
+        except RedisError:
+            logger.exception("Failed to store tutorial cards")
+    return found
+
+
+async def invalidate_cards(tutor_id: TutorialID) -> None:
+    cards.invalidate(tutor_id)
+    try:
+        await get_redis().delete(redis_key(tutor_id))
+    except RedisError:
+        logger.exception("Failed to drop the cards of tutorial %s", tutor_id)
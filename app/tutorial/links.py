@@ -0,0 +1,80 @@
+"""
+One-off job that hashes the source links of the tutorials added before 'source_link_hash' existed
+and finds the duplicated links among them.
+
+The tutorials are walked in 'id' order, one batch at a time. The hashes of a batch are looked up
+in the 'source_link_hash' unique index with one query, so there is no self-join of the whole table.
+The first tutorial with a link gets the hash, the later ones are reported as its duplicates
+and keep NULL until somebody edits or deletes them.
+
+CLI: python -m app.tutorial.links
+"""
+
+import argparse
+import asyncio
+from typing import Dict, List, Tuple
+from sqlalchemy import Row, select, update
+from ..common.constants import LINK_HASH_BATCH_SIZE
+from ..db import DBSession, async_session
+from ..tools import url_hash
+from ..tutorial.models import TutorialModel
+from ..tutorial.schemas import TutorialID
+
+
+async def hash_links_batch(rows: List[Row], db_session: DBSession) -> List[Tuple[TutorialID, TutorialID]]:
+    """Returns (duplicate id, original id) pairs."""
+    hashes: Dict[TutorialID, str] = {row.id: url_hash(row.source_link) for row in rows}
+    result = await db_session.execute(
+        select(TutorialModel.source_link_hash, TutorialModel.id)
+        .where(TutorialModel.source_link_hash.in_(set(hashes.values())))
+    )
+    originals: Dict[str, TutorialID] = dict(result.tuples().all())
+
+    duplicates: List[Tuple[TutorialID, TutorialID]] = []
+    new_hashes: List[Dict] = []
+    for tutor_id, link_hash in hashes.items():
+        if link_hash in originals:
+            duplicates.append((tutor_id, originals[link_hash]))
+        else:
+            originals[link_hash] = tutor_id
+            new_hashes.append({"id": tutor_id, "source_link_hash": link_hash})
+
+    if new_hashes:
+        # ORM bulk UPDATE by primary key, one executemany
+        await db_session.execute(update(TutorialModel), new_hashes)
+    await db_session.commit()
+    return duplicates
+
+
+async def hash_links(
+        db_session: DBSession,
+        batch_size: int = LINK_HASH_BATCH_SIZE,
+) -> List[Tuple[TutorialID, TutorialID]]:
+
+    duplicates: List[Tuple[TutorialID, TutorialID]] = []
+    last_id: TutorialID = 0
+    while True:
+        result = await db_session.execute(
+            select(TutorialModel.id, TutorialModel.source_link)
+            .where(TutorialModel.source_link_hash.is_(None), TutorialModel.id > last_id)
+            .order_by(TutorialModel.id)
+            .limit(batch_size)
+        )
+        rows: List[Row] = result.all()
+        if not rows: return duplicates
+        duplicates += await hash_links_batch(rows, db_session)
+        last_id = rows[-1].id
+
+
+async def main(batch_size: int) -> None:
+    async with async_session() as db_session:
+        duplicates = await hash_links(db_session, batch_size)
+    for duplicate_id, original_id in duplicates:
+        print(f"{duplicate_id}\tduplicates\t{original_id}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hash the source links of old tutorials and find duplicates")
+    parser.add_argument("--batch-size", type=int, default=LINK_HASH_BATCH_SIZE)
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
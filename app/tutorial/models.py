@@ -1,4 +1,6 @@
-from sqlalchemy import ForeignKey, Integer, String
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from ..common.constants import Table
 from ..db import Base
@@ -13,5 +15,50 @@ class TutorialModel(Base):
     description: Mapped[str] = mapped_column(String(length=1024), nullable=False)
     lang_code: Mapped[int] = mapped_column(Integer, ForeignKey(Table.Language.language_code))
     source_link: Mapped[str] = mapped_column(String(length=256), nullable=False)
+    # sha256 of the normalized 'source_link', NULL until 'app.tutorial.links' has hashed the old rows
+    source_link_hash: Mapped[str | None] = mapped_column(String(length=64), nullable=True)
     dist_type_code: Mapped[int] = mapped_column(Integer, ForeignKey(Table.DistributionType.distribution_type_code))
     who_added_id: Mapped[int] = mapped_column(Integer, ForeignKey(Table.User.user_id))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    # filled by the 'tutorial_search_vector_update' trigger (see migrations)
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+
+    __table_args__ = (
+        # the listing is paginated by 'id', so the filter columns go first and 'id' goes last,
+        # every single filter has its own index, they also serve the foreign keys
+        Index("ix_tutorial_type_code_id", "type_code", "id"),
+        Index("ix_tutorial_theme_code_id", "theme_code", "id"),
+        Index("ix_tutorial_lang_code_id", "lang_code", "id"),
+        Index("ix_tutorial_dist_type_code_id", "dist_type_code", "id"),
+        Index("ix_tutorial_type_code_theme_code_id", "type_code", "theme_code", "id"),
+        Index("ix_tutorial_lang_code_type_code_id", "lang_code", "type_code", "id"),
+        Index("ix_tutorial_dist_type_code_lang_code_id", "dist_type_code", "lang_code", "id"),
+        # sort orders, see 'tutorial_sort_keys'
+        Index("ix_tutorial_created_at_id", "created_at", "id"),
+        Index("ix_tutorial_updated_at_id", "updated_at", "id"),
+        Index("ix_tutorial_who_added_id_id", "who_added_id", "id"),
+        Index("ix_tutorial_lang_code_title_id", "lang_code", "title", "id"),
+        Index(
+            "ix_tutorial_source_link_hash", "source_link_hash", unique=True,
+            postgresql_where=text("source_link_hash IS NOT NULL"),
+        ),
+        Index("ix_tutorial_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_tutorial_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
+
+
+class TutorialVisitsModel(Base):
+    __tablename__ = Table.TutorialVisits.table_name
+    tutorial_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey(Table.Tutorial.tutorial_id, ondelete="CASCADE"), primary_key=True
+    )
+    visits: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        # the "most visited" listing, see 'tutorial_sort_keys'
+        Index("ix_tutorial_visits_visits_tutorial_id", "visits", "tutorial_id"),
+    )
@@ -1,25 +1,30 @@
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, Form
+import io
+from typing import Annotated
+from fastapi import APIRouter, Depends, Form, Query, UploadFile
 from pydantic import HttpUrl
 from starlette import status
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, RedirectResponse, Response
+from starlette.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
 
-from .theme.crud import get_all_themes
-from .type.crud import get_all_types
-from ..common.constants import PAGINATION_OFFSET, PageVars
+from ..common.constants import PageVars
 from ..db import DBSession
 from ..language.crud import UILangCode
 from ..language.schemas import LangCode
+from ..conditional import conditional
+from ..pages import page_cache, purge_pages, tag_page
 from app.render import render_template
-from ..tools import parameter_checker
-from ..tutorial.crud import add_tutorial, delete_tutorial, edit_tutorial, get_all_tutorials, get_tutorial, tutorial_page
+from ..tools import parameter_checker, remove_dup_spaces
+from ..tutorial.bulk import BulkFormat, export_tutorials, import_tutorials
+from ..tutorial.crud import add_tutorial, autocomplete, delete_tutorial, edit_tutorial, get_all_tutorials, get_tutorial, \
+    get_source_link, search_tutorials, tutorial_page, tutorial_validator, tutorials_page, tutorials_validator
 from ..tutorial.dist_type.schemas import DistTypeCode
-from ..tutorial.schemas import Pagination, TutorialID, TutorialListSchema, TutorialSchema, DecodedTutorialSchema, \
-    ValidDescription, ValidTitle
-from ..tutorial.theme.schemas import ThemeCode, ThemeSchema
-from ..tutorial.type.schemas import TypeCode, TypeSchema
-from ..user.auth import decode_access_token, get_token, is_tutorial_editor
+from ..tutorial.schemas import AutocompleteSchema, Cursor, ImportReportSchema, Pagination, SearchQuery, TutorialID, \
+    TutorialListSchema, TutorialSchema, TutorialSort, DecodedTutorialSchema, ValidDescription, ValidTitle
+from ..tutorial.theme.schemas import ThemeCode
+from ..tutorial.type.schemas import TypeCode
+from ..tutorial.visits import cache_link, count_visit
+from ..user.schemas import UserID
+from ..user.auth import decode_access_token, get_token, is_admin, is_tutorial_editor
 
 
 tutorial_router = APIRouter(prefix="/tt", tags=["Tutorial"])
@@ -41,6 +46,50 @@ async def add_tutorial_page(
     )
 
 
+@tutorial_router.get("/{ui_lang_code}/search", response_class=HTMLResponse, response_model_exclude_none=True)
+@conditional(tutorials_validator)
+@parameter_checker()
+async def search__tutorials(
+        request: Request,
+        db_session: DBSession,
+        ui_lang_code: UILangCode,
+        q: Annotated[SearchQuery, Query(min_length=2, max_length=256)],
+        page: Pagination = 1,
+        cursor: Cursor | None = None,
+) -> Response:
+
+    tutors_list: TutorialListSchema = \
+        await search_tutorials(
+            search_query=q,
+            ui_lang_code=ui_lang_code,
+            page=page,
+            cursor=cursor,
+            db_session=db_session,
+        )
+    return await tutorials_page(
+        tutors_list=tutors_list,
+        ui_lang_code=ui_lang_code,
+        request=request,
+        db_session=db_session,
+        search_query=q,
+    )
+
+
+@tutorial_router.get("/{ui_lang_code}/ac", response_model_exclude_none=True)
+@parameter_checker()
+async def autocomplete__tutorials(
+        ui_lang_code: UILangCode,
+        db_session: DBSession,
+        q: Annotated[SearchQuery, Query(min_length=2, max_length=256)],
+) -> AutocompleteSchema:
+
+    return await autocomplete(
+        prefix=remove_dup_spaces(q).lower(),
+        ui_lang_code=ui_lang_code,
+        db_session=db_session,
+    )
+
+
 @tutorial_router.post("/{ui_lang_code}/add", response_model_exclude_none=True, dependencies=[Depends(get_token)])
 @parameter_checker()
 async def add__tutorial(
@@ -72,6 +121,39 @@ async def add__tutorial(
         return RedirectResponse(url=f"/tt/{ui_lang_code}/{tutor_id}", status_code=status.HTTP_302_FOUND)
 
 
+@tutorial_router.post("/{ui_lang_code}/import", dependencies=[Depends(is_admin)])
+@parameter_checker()
+async def import__tutorials(
+        file: UploadFile,
+        request: Request,
+        ui_lang_code: UILangCode,
+        db_session: DBSession,
+) -> ImportReportSchema:
+
+    who_added_id: UserID = decode_access_token(token=get_token(request)).id
+    report: ImportReportSchema = await import_tutorials(
+        stream=io.TextIOWrapper(file.file, encoding="utf-8-sig", newline=""),
+        fmt=BulkFormat.from_filename(file.filename),
+        who_added_id=who_added_id,
+        db_session=db_session,
+    )
+    if report.imported: await purge_pages("tutorials", f"user:{who_added_id}")
+    return report
+
+
+@tutorial_router.get("/{ui_lang_code}/export", dependencies=[Depends(is_admin)])
+@parameter_checker()
+async def export__tutorials(
+        ui_lang_code: UILangCode,
+        fmt: BulkFormat = BulkFormat.ndjson,
+) -> Response:
+    # sent as it is read, CompressionMiddleware compresses it on the way
+    headers = {"Content-Disposition": f'attachment; filename="tutorials-{ui_lang_code}.{fmt}"'}
+    return StreamingResponse(
+        content=export_tutorials(ui_lang_code=ui_lang_code, fmt=fmt), media_type=fmt.media_type, headers=headers
+    )
+
+
 @tutorial_router.get("/{ui_lang_code}/{tutor_id}/editp", response_model_exclude_none=True)
 @parameter_checker()
 async def edit_tutorial_page(
@@ -134,7 +216,28 @@ async def delete__tutorial(
         return RedirectResponse(url=f"/tt/{ui_lang_code}", status_code=status.HTTP_302_FOUND)
 
 
+@tutorial_router.get("/{ui_lang_code}/{tutor_id}/go", response_class=RedirectResponse)
+@parameter_checker()
+async def go__tutorial(
+        ui_lang_code: UILangCode,
+        tutor_id: TutorialID,
+        db_session: DBSession,
+) -> Response:
+
+    # the DB is only asked for the links that aren't cached yet
+    source_link: str | None = await count_visit(tutor_id)
+    if source_link is None:
+        source_link = await get_source_link(
+            tutor_id=tutor_id,
+            db_session=db_session,
+        )
+        await cache_link(tutor_id, source_link)
+    return RedirectResponse(url=source_link, status_code=status.HTTP_302_FOUND)
+
+
 @tutorial_router.get("/{ui_lang_code}/{tutor_id}", response_class=HTMLResponse, response_model_exclude_none=True)
+@conditional(tutorial_validator)
+@page_cache()
 @parameter_checker()
 async def get__tutorial(
         request: Request,
@@ -149,6 +252,14 @@ async def get__tutorial(
             ui_lang_code=ui_lang_code,
             db_session=db_session,
         )
+    tag_page(
+        f"tutorial:{tutor.id}",
+        f"user:{tutor.who_added_id}",
+        f"type:{tutor.type_code}",
+        f"theme:{tutor.theme_code}",
+        f"dist_type:{tutor.dist_type_code}",
+        f"lang:{tutor.lang_code}",
+    )
 
     is_editor: bool = True if await is_tutorial_editor(
         tutor_id=tutor_id,
@@ -171,16 +282,20 @@ async def get__tutorial(
 
 
 @tutorial_router.get("/{ui_lang_code}", response_class=HTMLResponse, response_model_exclude_none=True)
+@conditional(tutorials_validator)
+@page_cache()
 @parameter_checker()
 async def get__all_tutorials(
         request: Request,
         db_session: DBSession,
         ui_lang_code: UILangCode,
         page: Pagination = 1,
+        cursor: Cursor | None = None,
         type_code: TypeCode | None = None,
         theme_code: ThemeCode | None = None,
         dist_type_code: DistTypeCode | None = None,
         tutor_lang_code: LangCode | None = None,
+        sort: TutorialSort | None = None,
 ) -> Response:
 
     tutors_list: TutorialListSchema = \
@@ -190,26 +305,15 @@ async def get__all_tutorials(
             theme_code=theme_code,
             dist_type_code=dist_type_code,
             tutor_lang_code=tutor_lang_code,
+            sort=sort,
             page=page,
+            cursor=cursor,
             db_session=db_session,
         )
-    tutor_types: List[TypeSchema] = await get_all_types(
-        db_session=db_session,
-    )
-    tutor_themes: List[ThemeSchema] = await get_all_themes(
-        db_session=db_session,
-    )
-    page_vars = {
-        PageVars.page: PageVars.Page.main,
-        PageVars.ui_lang_code: ui_lang_code,
-        "tutors": tutors_list.tutorials,
-        "tutor_types": tutor_types,
-        "tutor_themes": tutor_themes,
-        "current_page": page,
-        "is_next_page": True if (tutors_list.total_count / PAGINATION_OFFSET) - page > 0 else False,
-    }
-    return await render_template(
+    return await tutorials_page(
+        tutors_list=tutors_list,
+        ui_lang_code=ui_lang_code,
         request=request,
         db_session=db_session,
-        page_vars=page_vars,
+        sort=sort,
     )
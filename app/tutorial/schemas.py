@@ -1,3 +1,5 @@
+from datetime import datetime
+from enum import StrEnum
 from typing import Annotated, List
 
 from fastapi import Query
@@ -45,12 +47,36 @@ Description = Annotated[str, DescriptionSchema]
 ValidDescription = Annotated[str, ValidDescriptionSchema]
 
 
+class SearchQuerySchema(BaseModel):
+    search_query: str | None = None
+
+    @validator("search_query")
+    def check_value(cls, value: str):
+        return value if 1 < len(value := remove_dup_spaces(value)) <= 256 else None
+
+SearchQuery = Annotated[str, SearchQuerySchema]
+
+
 class PaginationSchema(BaseModel):
     page: int = 1
 
 Pagination = Annotated[int, PaginationSchema]
 
 
+class TutorialSort(StrEnum):
+    newest = "newest"
+    updated = "updated"
+    rating = "rating"
+    title = "title"
+    visited = "visited"
+
+
+class CursorSchema(BaseModel):
+    cursor: str | None = None
+
+Cursor = Annotated[str, CursorSchema]
+
+
 class TutorialSchema(
     TutorialIDSchema,
     TitleSchema,
@@ -73,8 +99,32 @@ class DecodedTutorialSchema(
     language: LangValue
     dist_type: DictValue
     who_added: UserName
+    updated_at: datetime | None = None
 
 
 class TutorialListSchema(BaseModel):
     tutorials: List[DecodedTutorialSchema]
-    total_count: int
+    page: Pagination
+    next_cursor: Cursor | None = None
+    prev_cursor: Cursor | None = None
+
+
+class SuggestionSchema(BaseModel):
+    id: int
+    label: str
+
+
+class AutocompleteSchema(BaseModel):
+    tutorials: List[SuggestionSchema] = []
+    types: List[SuggestionSchema] = []
+    themes: List[SuggestionSchema] = []
+
+
+class ImportErrorSchema(BaseModel):
+    line: int
+    detail: str
+
+
+class ImportReportSchema(BaseModel):
+    imported: int = 0
+    errors: List[ImportErrorSchema] = []
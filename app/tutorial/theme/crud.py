@@ -1,50 +1,39 @@
 from typing import List
-from sqlalchemy import Result, Row, ScalarResult, and_, delete, func, select, update
+from sqlalchemy import Result, Row, and_, delete, select, update
 from ..type.schemas import TypeCode
-from ...common.exceptions import CommonExceptions, DatabaseExceptions
+from ...common.constants import WordKind
+from ...common.exceptions import CommonExceptions
 from ...common.responses import CommonResponses, ResponseSchema
 from ...db import DBSession
+from ...dictionary.crud import add_translated_word, add_word
 from ...dictionary.models import DictionaryModel
 from ...language.schemas import LangCode
+from ...pages import purge_pages
+from ...registry import Taxonomy, registry
 from ...tools import db_checker
 from ...tutorial.theme.models import ThemeModel
-from ...tutorial.theme.schemas import ThemeSchema, ThemeCode
+from ...tutorial.theme.schemas import ThemeSchema, ThemeCode, ThemeWordSchema
 
 
 @db_checker()
 async def add_theme(theme: ThemeSchema, db_session: DBSession) -> ResponseSchema:
-    is_word_code: bool = True if theme.word_code else False
-    if not is_word_code:
-        result: Result = await db_session.execute(
-            select(DictionaryModel.lang_code, DictionaryModel.value)
-        )
-        for row in result.all():
-            if row.lang_code == theme.lang_code and row.value == theme.dict_value:
-                raise DatabaseExceptions.DUPLICATED_ENTRY
-
-        result: ScalarResult = await db_session.scalars(func.max(DictionaryModel.word_code))
-        max_word_code: int | None = result.one_or_none()
-        theme.word_code = max_word_code + 1 if max_word_code else 1
-
-    new_word = DictionaryModel(
-        word_code=theme.word_code,
-        lang_code=theme.lang_code,
-        value=theme.dict_value
-    )
-    db_session.add(new_word)
+    # a new word is inserted together with its theme row, a translation is just a new word
+    await add_word(theme, kind=WordKind.theme, db_session=db_session, owner=ThemeModel, type_code=theme.type_code)
     await db_session.commit()
+    await registry.reload(db_session)
+    await purge_pages("taxonomy")
+    return CommonResponses.CREATED
 
-    if not is_word_code:
-        await db_session.refresh(new_word)
 
-        new_theme = ThemeModel(
-            word_code=new_word.word_code,
-            type_code=theme.type_code
-        )
-        db_session.add(new_theme)
-        await db_session.commit()
-
-    return CommonResponses.CREATED
+@db_checker()
+async def add_theme_word(word: ThemeWordSchema, db_session: DBSession) -> ThemeCode:
+    theme_code: ThemeCode = await add_translated_word(
+        word, kind=WordKind.theme, db_session=db_session, owner=ThemeModel, type_code=word.type_code
+    )
+    await db_session.commit()
+    await registry.reload(db_session)
+    await purge_pages("taxonomy")
+    return theme_code
 
 
 @db_checker()
@@ -72,6 +61,8 @@ async def edit_theme(theme: ThemeSchema, db_session: DBSession) -> ResponseSchem
         )
 
     await db_session.commit()
+    await registry.reload(db_session)
+    await purge_pages("taxonomy", f"theme:{theme.theme_code}")
     return CommonResponses.SUCCESS
 
 
@@ -90,60 +81,29 @@ async def delete_theme(theme_code: ThemeCode, db_session: DBSession) -> Response
     await db_session.delete(theme_from_db)
 
     await db_session.commit()
+    await registry.reload(db_session)
+    await purge_pages("taxonomy", f"theme:{theme_code}")
     return CommonResponses.SUCCESS
 
 
 @db_checker()
 async def get_theme(theme_code: ThemeCode, ui_lang_code: LangCode, db_session: DBSession) -> ThemeSchema:
-    result: Result = await db_session.execute(
-        select(ThemeModel.code, ThemeModel.type_code, ThemeModel.word_code, DictionaryModel.value)
-        .where(and_(
-            ThemeModel.code == theme_code,
-            ThemeModel.word_code == DictionaryModel.word_code),
-            DictionaryModel.lang_code == ui_lang_code
-        )
+    taxonomy: Taxonomy = await registry.get(db_session)
+    theme: ThemeSchema | None = next(
+        (th for th in taxonomy.themes_by_lang.get(ui_lang_code, ()) if th.theme_code == theme_code), None
     )
-
-    theme: Row = result.one()
+    if not theme: raise CommonExceptions.NOTHING_FOUND
     return ThemeSchema(
-        theme_code=theme.code,
-        dict_value=theme.value,
+        theme_code=theme.theme_code,
+        dict_value=theme.dict_value,
         type_code=theme.type_code,
     )
 
 
 @db_checker()
 async def get_all_themes(db_session: DBSession, ui_lang_code: LangCode | None = None) -> List[ThemeSchema]:
-    result: Result = await db_session.execute(
-        select(
-            ThemeModel.code,
-            ThemeModel.type_code,
-            ThemeModel.word_code,
-            DictionaryModel.value,
-            DictionaryModel.lang_code,
-        )
-        .where(
-            and_(
-                ThemeModel.word_code == DictionaryModel.word_code,
-                DictionaryModel.lang_code == ui_lang_code
-            )
-            if ui_lang_code else
-                ThemeModel.word_code == DictionaryModel.word_code,
-        )
-        .order_by(DictionaryModel.value)
-    )
-
-    theme_list = []
-    for theme in result.all():
-        theme_list.append(
-            ThemeSchema(
-                theme_code=theme.code,
-                dict_value=theme.value,
-                type_code=theme.type_code,
-                word_code=theme.word_code,
-                lang_code=theme.lang_code,
-            )
-        )
+    taxonomy: Taxonomy = await registry.get(db_session)
+    theme_list = list(taxonomy.themes_by_lang.get(ui_lang_code, ()) if ui_lang_code else taxonomy.themes)
     if not theme_list: raise CommonExceptions.NOTHING_FOUND
     return theme_list
 
@@ -155,25 +115,7 @@ async def get_all_allowed_themes(
         db_session: DBSession
 ) -> List[ThemeSchema]:
 
-    result: Result = await db_session.execute(
-        select(ThemeModel.code, ThemeModel.word_code, DictionaryModel.value)
-        .where(and_(
-            ThemeModel.type_code == type_code,
-            ThemeModel.word_code == DictionaryModel.word_code,
-            DictionaryModel.lang_code == ui_lang_code
-        ))
-        .order_by(DictionaryModel.value)
-    )
-
-    theme_list = []
-    for theme in result.all():
-        theme_list.append(
-            ThemeSchema(
-                theme_code=theme.code,
-                dict_value=theme.value,
-                type_code=theme.type_code,
-                word_code=theme.word_code,
-            )
-        )
+    taxonomy: Taxonomy = await registry.get(db_session)
+    theme_list = [theme for theme in taxonomy.themes_by_lang.get(ui_lang_code, ()) if theme.type_code == type_code]
     if not theme_list: raise CommonExceptions.NOTHING_FOUND
     return theme_list
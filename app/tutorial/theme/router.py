@@ -1,13 +1,15 @@
 from typing import Annotated, List
 from fastapi import APIRouter, Depends, Form, Path
 from starlette import status
+from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
+from ...conditional import conditional, registry_validator
 from ...db import DBSession
 from ...dictionary.schemas import DictWordCode, ValidDictValue
 from ...language.schemas import LangCode
 from ...tools import parameter_checker
-from ...tutorial.theme.crud import add_theme, delete_theme, edit_theme, get_all_themes, get_theme
-from ...tutorial.theme.schemas import ThemeSchema, ThemeCode
+from ...tutorial.theme.crud import add_theme, add_theme_word, delete_theme, edit_theme, get_all_themes, get_theme
+from ...tutorial.theme.schemas import ThemeSchema, ThemeCode, ThemeCodeSchema, ThemeWordSchema
 from ...tutorial.type.schemas import TypeCode
 from ...user.auth import is_admin
 
@@ -38,6 +40,24 @@ async def add__theme(
         return RedirectResponse(url=f"/adm/{ui_lang_code}", status_code=status.HTTP_302_FOUND)
 
 
+@theme_router.post(
+    "/{ui_lang_code}/add-word", status_code=status.HTTP_201_CREATED, dependencies=[Depends(is_admin)]
+)
+@parameter_checker()
+async def add__theme_word(
+        word: ThemeWordSchema,
+        ui_lang_code: Annotated[LangCode, Path()],
+        db_session: DBSession,
+) -> ThemeCodeSchema:
+
+    return ThemeCodeSchema(
+        theme_code=await add_theme_word(
+            word=word,
+            db_session=db_session,
+        )
+    )
+
+
 @theme_router.post("/{ui_lang_code}/{theme_code}/edit", dependencies=[Depends(is_admin)])
 @parameter_checker()
 async def edit__theme(
@@ -77,11 +97,14 @@ async def delete__theme(
 
 
 @theme_router.get("/{ui_lang_code}/{theme_code}", response_model_exclude_none=True)
+@conditional(registry_validator)
 @parameter_checker()
 async def get__theme(
         theme_code: Annotated[ThemeCode, Path()],
         ui_lang_code: Annotated[LangCode, Path()],
         db_session: DBSession,
+        request: Request,
+        response: Response,
 ) -> ThemeSchema:
 
     return await get_theme(
@@ -92,10 +115,13 @@ async def get__theme(
 
 
 @theme_router.get("/{ui_lang_code}", response_model_exclude_none=True)
+@conditional(registry_validator)
 @parameter_checker()
 async def get__all_themes(
         ui_lang_code: Annotated[LangCode, Path()],
-        db_session: DBSession
+        db_session: DBSession,
+        request: Request,
+        response: Response,
 ) -> List[ThemeSchema]:
 
     return await get_all_themes(
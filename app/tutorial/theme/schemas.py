@@ -1,6 +1,6 @@
 from typing import Annotated
 from pydantic import BaseModel
-from ...dictionary.schemas import DictionarySchema
+from ...dictionary.schemas import DictionarySchema, WordSchema
 from ...tutorial.type.schemas import TypeCodeSchema
 
 
@@ -16,3 +16,9 @@ class ThemeSchema(
     DictionarySchema,
 ):
     pass
+
+
+class ThemeWordSchema(
+    WordSchema,
+):
+    type_code: int
@@ -1,11 +1,15 @@
 from typing import List
-from sqlalchemy import Result, Row, ScalarResult, and_, delete, func, insert, select, update
-from ...common.exceptions import CommonExceptions, DatabaseExceptions
+from sqlalchemy import Result, Row, and_, delete, select
+from ...common.constants import WordKind
+from ...common.exceptions import CommonExceptions
 from ...common.responses import CommonResponses, ResponseSchema
 from ...db import DBSession
+from ...dictionary.crud import add_translated_word, add_word
 from ...dictionary.models import DictionaryModel
-from ...dictionary.schemas import DictionarySchema
+from ...dictionary.schemas import DictionarySchema, WordSchema
 from ...language.schemas import LangCode
+from ...pages import purge_pages
+from ...registry import Taxonomy, registry
 from ...tools import db_checker
 from ...tutorial.type.models import TypeModel
 from ...tutorial.type.schemas import TypeCode, TypeSchema
@@ -13,37 +17,21 @@ from ...tutorial.type.schemas import TypeCode, TypeSchema
 
 @db_checker()
 async def add_type(tutor_type: DictionarySchema, db_session: DBSession) -> ResponseSchema:
-    is_word_code: bool = True if tutor_type.word_code else False
-    if not is_word_code:
-        result: Result = await db_session.execute(
-            select(DictionaryModel.lang_code, DictionaryModel.value)
-        )
-        for row in result.all():
-            if row.lang_code == tutor_type.lang_code and row.value == tutor_type.dict_value:
-                raise DatabaseExceptions.DUPLICATED_ENTRY
-
-        result: ScalarResult = await db_session.scalars(func.max(DictionaryModel.word_code))
-        max_word_code: int | None = result.one_or_none()
-        tutor_type.word_code = max_word_code + 1 if max_word_code else 1
-
-    new_word = DictionaryModel(
-        word_code=tutor_type.word_code,
-        lang_code=tutor_type.lang_code,
-        value=tutor_type.dict_value,
-    )
-    db_session.add(new_word)
+    # a new word is inserted together with its type row, a translation is just a new word
+    await add_word(tutor_type, kind=WordKind.type, db_session=db_session, owner=TypeModel)
     await db_session.commit()
+    await registry.reload(db_session)
+    await purge_pages("taxonomy")
+    return CommonResponses.CREATED
 
-    if not is_word_code:
-        await db_session.refresh(new_word)
-
-        new_tutor_type = TypeModel(
-            word_code=new_word.word_code
-        )
-        db_session.add(new_tutor_type)
-        await db_session.commit()
 
-    return CommonResponses.CREATED
+@db_checker()
+async def add_type_word(word: WordSchema, db_session: DBSession) -> TypeCode:
+    type_code: TypeCode = await add_translated_word(word, kind=WordKind.type, db_session=db_session, owner=TypeModel)
+    await db_session.commit()
+    await registry.reload(db_session)
+    await purge_pages("taxonomy")
+    return type_code
 
 
 @db_checker()
@@ -60,6 +48,8 @@ async def edit_type(tutor_type: TypeSchema, db_session: DBSession) -> ResponseSc
     new_value.DictionaryModel.value = tutor_type.dict_value
     await db_session.merge(new_value.DictionaryModel)
     await db_session.commit()
+    await registry.reload(db_session)
+    await purge_pages("taxonomy", f"type:{tutor_type.type_code}")
     return CommonResponses.SUCCESS
 
 
@@ -78,56 +68,27 @@ async def delete_type(type_code: TypeCode, db_session: DBSession) -> ResponseSch
     await db_session.delete(tutor_type_from_db)
 
     await db_session.commit()
+    await registry.reload(db_session)
+    await purge_pages("taxonomy", f"type:{type_code}")
     return CommonResponses.SUCCESS
 
 
 @db_checker()
 async def get_type(type_code: TypeCode, ui_lang_code: LangCode, db_session: DBSession) -> TypeSchema:
-    result: Result = await db_session.execute(
-        select(TypeModel.code, DictionaryModel.value)
-        .where(and_(
-            TypeModel.word_code == DictionaryModel.word_code,
-            TypeModel.code == type_code,
-            DictionaryModel.lang_code == ui_lang_code
-        ))
+    taxonomy: Taxonomy = await registry.get(db_session)
+    type_: TypeSchema | None = next(
+        (tp for tp in taxonomy.types_by_lang.get(ui_lang_code, ()) if tp.type_code == type_code), None
     )
-
-    type_: Row = result.one()
+    if not type_: raise CommonExceptions.NOTHING_FOUND
     return TypeSchema(
-        type_code=type_.code,
-        dict_value=type_.value,
+        type_code=type_.type_code,
+        dict_value=type_.dict_value,
     )
 
 
 @db_checker()
 async def get_all_types(db_session: DBSession, ui_lang_code: LangCode | None = None) -> List[TypeSchema]:
-    result: Result = await db_session.execute(
-        select(
-            TypeModel.code,
-            DictionaryModel.word_code,
-            DictionaryModel.value,
-            DictionaryModel.lang_code,
-        )
-        .where(
-            and_(
-                TypeModel.word_code == DictionaryModel.word_code,
-                DictionaryModel.lang_code == ui_lang_code
-            )
-            if ui_lang_code else
-                TypeModel.word_code == DictionaryModel.word_code
-        )
-        .order_by(DictionaryModel.value)
-    )
-
-    type_list = []
-    for row in result.all():
-        type_list.append(
-            TypeSchema(
-                type_code=row.code,
-                dict_value=row.value,
-                word_code=row.word_code,
-                lang_code=row.lang_code,
-            )
-        )
+    taxonomy: Taxonomy = await registry.get(db_session)
+    type_list = list(taxonomy.types_by_lang.get(ui_lang_code, ()) if ui_lang_code else taxonomy.types)
     if not type_list: raise CommonExceptions.NOTHING_FOUND
     return type_list
@@ -1,14 +1,16 @@
 from typing import Annotated, List
 from fastapi import APIRouter, Depends, Form, Path
 from starlette import status
+from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
+from ...conditional import conditional, registry_validator
 from ...db import DBSession
-from ...dictionary.schemas import DictWordCode, DictionarySchema, ValidDictValue
+from ...dictionary.schemas import DictWordCode, DictionarySchema, ValidDictValue, WordSchema
 from ...language.crud import UILangCode
 from ...language.schemas import LangCode
 from ...tools import parameter_checker
-from ...tutorial.type.crud import add_type, delete_type, edit_type, get_all_types, get_type
-from ...tutorial.type.schemas import TypeCode, TypeSchema
+from ...tutorial.type.crud import add_type, add_type_word, delete_type, edit_type, get_all_types, get_type
+from ...tutorial.type.schemas import TypeCode, TypeCodeSchema, TypeSchema
 from ...user.auth import is_admin
 
 
@@ -36,6 +38,24 @@ async def add_tutorial_type(
         return RedirectResponse(url=f"/adm/{ui_lang_code}", status_code=status.HTTP_302_FOUND)
 
 
+@type_router.post(
+    "/{ui_lang_code}/add-word", status_code=status.HTTP_201_CREATED, dependencies=[Depends(is_admin)]
+)
+@parameter_checker()
+async def add_tutorial_type_word(
+        word: WordSchema,
+        ui_lang_code: Annotated[LangCode, Path()],
+        db_session: DBSession,
+) -> TypeCodeSchema:
+
+    return TypeCodeSchema(
+        type_code=await add_type_word(
+            word=word,
+            db_session=db_session,
+        )
+    )
+
+
 @type_router.post("/{ui_lang_code}/{type_code}/edit", dependencies=[Depends(is_admin)])
 @parameter_checker()
 async def edit_tutorial_type(
@@ -73,11 +93,14 @@ async def delete_tutorial_type(
 
 
 @type_router.get("/{ui_lang_code}/{type_code}", response_model_exclude_none=True)
+@conditional(registry_validator)
 @parameter_checker()
 async def get_tutorial_type(
         type_code: Annotated[TypeCode, Path()],
         ui_lang_code: UILangCode,
         db_session: DBSession,
+        request: Request,
+        response: Response,
 ) -> TypeSchema:
 
     return await get_type(
@@ -88,10 +111,13 @@ async def get_tutorial_type(
 
 
 @type_router.get("/{ui_lang_code}", response_model_exclude_none=True)
+@conditional(registry_validator)
 @parameter_checker()
 async def get_all_tutorial_types(
     ui_lang_code: UILangCode,
     db_session: DBSession,
+    request: Request,
+    response: Response,
 ) -> List[TypeSchema]:
 
     return await get_all_types(
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Dict
+from fastapi_cache import FastAPICache
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import Integer, column, select, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from ..common.constants import LINK_EXPIRE, LINK_KEY, VISITS_FLUSH_INTERVAL, VISITS_KEY
+from ..db import async_session
+from ..tutorial.models import TutorialModel, TutorialVisitsModel
+from ..tutorial.schemas import TutorialID
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_redis() -> Redis:
+    return FastAPICache.get_backend().redis
+
+
+def link_key(tutor_id: TutorialID) -> str:
+    return f"{LINK_KEY}:{tutor_id}"
+
+
+async def count_visit(tutor_id: TutorialID) -> str | None:
+    """
+    Counts the click and returns the cached source link with one round trip, None if it isn't cached.
+    The clicks of unknown ids are dropped by the flush. Without Redis the click isn't counted.
+    """
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            source_link, _ = await pipe.get(link_key(tutor_id)).hincrby(VISITS_KEY, str(tutor_id), 1).execute()
+    except RedisError:
+        logger.exception("Failed to count a visit of tutorial %s", tutor_id)
+        return None
+    return source_link.decode() if source_link else None
+
+
+async def cache_link(tutor_id: TutorialID, source_link: str) -> None:
+    try:
+        await get_redis().set(link_key(tutor_id), source_link, ex=LINK_EXPIRE)
+    except RedisError:
+        logger.exception("Failed to cache the link of tutorial %s", tutor_id)
+
+
+async def forget_link(tutor_id: TutorialID) -> None:
+    try:
+        await get_redis().delete(link_key(tutor_id))
+    except RedisError:
+        logger.exception("Failed to drop the link of tutorial %s", tutor_id)
+
+
+async def flush_visits() -> int:
+    """
+    Moves the buffered counters to 'tutorial_visits' with one upsert, returns the number of flushed tutorials.
+    The hash is read and deleted atomically, clicks made during the flush go to the next one.
+    """
+    redis: Redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        buffered, _ = await pipe.hgetall(VISITS_KEY).delete(VISITS_KEY).execute()
+    if not buffered: return 0
+
+    counters: Dict[int, int] = {int(tutor_id): int(visits) for tutor_id, visits in buffered.items()}
+    clicks = (
+        values(column("tutorial_id", Integer), column("visits", Integer), name="clicks", literal_binds=True)
+        .data(list(counters.items()))
+    )
+    # the join skips tutorials deleted after the click
+    statement = insert(TutorialVisitsModel).from_select(
+        [TutorialVisitsModel.tutorial_id, TutorialVisitsModel.visits],
+        select(clicks.c.tutorial_id, clicks.c.visits)
+        .join(TutorialModel, TutorialModel.id == clicks.c.tutorial_id),
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[TutorialVisitsModel.tutorial_id],
+        set_={"visits": TutorialVisitsModel.visits + statement.excluded.visits},
+    )
+    try:
+        async with async_session() as db_session:
+            await db_session.execute(statement)
+            await db_session.commit()
+    except SQLAlchemyError:
+        # the counters go back to the buffer and are retried by the next flush
+        async with redis.pipeline(transaction=True) as pipe:
+            for tutor_id, visits in counters.items():
+                pipe.hincrby(VISITS_KEY, str(tutor_id), visits)
+            await pipe.execute()
+        raise
+    return len(counters)
+
+
+async def flush_visits_periodically(interval: float = VISITS_FLUSH_INTERVAL) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_visits()
+        except Exception:
+            logger.exception("Failed to flush tutorial visits")
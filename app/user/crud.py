@@ -1,11 +1,16 @@
-from typing import List
+from datetime import datetime
+from typing import Any, List
 from sqlalchemy import Result, Row, select, update
+from starlette.requests import Request
 from .exceptions import UserExceptions
 from ..common.constants import DecodedCredential
 from ..common.exceptions import CommonExceptions
+from ..conditional import Validator, page_validator
 from ..db import DBSession
+from ..pages import purge_pages
 from ..tools import db_checker
 from ..user.auth import Credential, get_hashed_password
+from ..language.schemas import LangCode
 from ..user.schemas import IsActive, UserSchema, UserID
 from ..user.models import UserModel
 
@@ -36,6 +41,7 @@ async def edit_user(user: UserSchema, db_session: DBSession) -> bool:
         )
     )
     await db_session.commit()
+    await purge_pages(f"user:{user.id}")
     return True
 
 
@@ -56,6 +62,7 @@ async def update_user_status(
         )
     )
     await db_session.commit()
+    await purge_pages(f"user:{user_id}")
     return True
 
 
@@ -69,6 +76,7 @@ async def delete_user(user_id: UserID, db_session: DBSession) -> bool:
         update(UserModel).where(UserModel.id == user_id, UserModel.is_active == True).values(is_active=False)
     )
     await db_session.commit()
+    await purge_pages(f"user:{user_id}")
     return True
 
 
@@ -127,3 +135,15 @@ async def get_all_users(db_session: DBSession) -> List[UserSchema]:
         )
     if not users: raise CommonExceptions.NOTHING_FOUND
     return users
+
+
+async def user_validator(
+        request: Request,
+        ui_lang_code: LangCode,
+        user_id: UserID,
+        db_session: DBSession,
+        **_: Any,
+) -> Validator | None:
+    updated_at: datetime | None = await db_session.scalar(select(UserModel.updated_at).where(UserModel.id == user_id))
+    if not updated_at: return None
+    return await page_validator(request, ui_lang_code, updated_at, modified=(updated_at,))
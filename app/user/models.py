@@ -1,5 +1,6 @@
+from datetime import datetime
 from pydantic import EmailStr
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 from ..common.constants import Credential, Table
 from ..db import Base
@@ -14,3 +15,12 @@ class UserModel(Base):
     credential: Mapped[int] = mapped_column(Integer, default=Credential.user)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     rating: Mapped[int] = mapped_column(Integer, default=0)
+    # the validator of the profile pages, see 'app/conditional.py'
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    # tutorials sorted by contributor rating, see 'tutorial_sort_keys'
+    __table_args__ = (
+        Index("ix_user_rating_id", "rating", "id"),
+    )
@@ -8,10 +8,12 @@ from starlette.responses import HTMLResponse, RedirectResponse, Response
 from ..common.constants import AccessToken, Credential, PageVars
 from ..db import DBSession
 from ..language.crud import UILangCode
+from ..conditional import conditional
+from ..pages import page_cache, tag_page
 from app.render import render_template
 from ..tools import parameter_checker
 from ..user.auth import Token, authenticate_user, create_access_token, is_admin, is_me_or_admin, get_token
-from ..user.crud import add_user, delete_user, edit_user, get_user, update_user_status
+from ..user.crud import add_user, delete_user, edit_user, get_user, update_user_status, user_validator
 from ..user.schemas import EMail, IsActive, Password, UserID, UserSchema, ValidUserName
 
 
@@ -146,6 +148,7 @@ async def delete__user(
 
 
 @user_router.get("/{ui_lang_code}/{user_id}/me", response_class=HTMLResponse, dependencies=[Depends(is_me_or_admin)])
+@conditional(user_validator)
 @parameter_checker()
 async def get__me(
         user_id: UserID,
@@ -169,6 +172,8 @@ async def get__me(
 
 
 @user_router.get("/{ui_lang_code}/{user_id}", response_class=HTMLResponse)
+@conditional(user_validator)
+@page_cache()
 @parameter_checker()
 async def get__user(
         user_id: UserID,
@@ -178,6 +183,7 @@ async def get__user(
 ) -> Response:
 
     userdata: UserSchema = await get_user(user_id=user_id, db_session=db_session)
+    tag_page(f"user:{user_id}")
 
     page_vars = {
         PageVars.page: PageVars.Page.profile,
@@ -0,0 +1,64 @@
+"""Dictionary word kind and unique values
+
+Revision ID: 2c7d5e8a4f19
+Revises: b0c96d4e3f71
+Create Date: 2026-10-18 14:02:33.650184
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c7d5e8a4f19'
+down_revision = 'b0c96d4e3f71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # the index below is built after a commit, so a failed build reruns the whole upgrade
+    op.execute("ALTER TABLE dictionary ADD COLUMN IF NOT EXISTS kind SMALLINT")
+    # WordKind: 1 - type, 2 - theme, 3 - dist_type
+    op.execute("UPDATE dictionary SET kind = 1 FROM type WHERE type.word_code = dictionary.word_code")
+    op.execute("UPDATE dictionary SET kind = 2 FROM theme WHERE theme.word_code = dictionary.word_code")
+    op.execute(
+        "UPDATE dictionary SET kind = 3 FROM distribution_type "
+        "WHERE distribution_type.word_code = dictionary.word_code"
+    )
+    # words left by an add that failed between its two commits, nothing refers to them
+    op.execute("DELETE FROM dictionary WHERE kind IS NULL")
+    op.alter_column('dictionary', 'kind', nullable=False)
+
+    # the same translation added twice to one word, the first row stays
+    op.execute(
+        "DELETE FROM dictionary AS d USING dictionary AS kept "
+        "WHERE d.word_code = kept.word_code AND d.lang_code = kept.lang_code AND d.value = kept.value "
+        "AND d.kind = kept.kind AND d.id > kept.id"
+    )
+    # different words with the same value are different types/themes, they can't be merged here
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT kind, lang_code, value, array_agg(word_code ORDER BY word_code) AS word_codes FROM dictionary "
+        "GROUP BY kind, lang_code, value HAVING count(*) > 1 ORDER BY kind, lang_code, value"
+    )).all()
+    if duplicates:
+        raise RuntimeError(
+            "Rename or merge these words before the upgrade (kind, lang_code, value: word codes):\n" + "\n".join(
+                f"{row.kind}, {row.lang_code}, {row.value!r}: {', '.join(map(str, row.word_codes))}"
+                for row in duplicates
+            )
+        )
+
+    with op.get_context().autocommit_block():
+        # an INVALID index left by a failed concurrent build
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_dictionary_kind_lang_code_value")
+        op.create_index(
+            'ix_dictionary_kind_lang_code_value', 'dictionary', ['kind', 'lang_code', 'value'], unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_dictionary_kind_lang_code_value', table_name='dictionary', postgresql_concurrently=True)
+    op.drop_column('dictionary', 'kind')
@@ -0,0 +1,27 @@
+"""User update timestamp
+
+Revision ID: 3e8c1f7a2b94
+Revises: 9a4f0b2d6c83
+Create Date: 2026-10-18 16:42:09.518306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e8c1f7a2b94'
+down_revision = '9a4f0b2d6c83'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # existing rows get the migration time
+    op.add_column('user', sa.Column(
+        'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+    ))
+
+
+def downgrade() -> None:
+    op.drop_column('user', 'updated_at')
@@ -0,0 +1,34 @@
+"""Trigram indexes
+
+Revision ID: 5d2a8f63b1e0
+Revises: c81e4b7a5d09
+Create Date: 2026-10-18 11:26:52.873104
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2a8f63b1e0'
+down_revision = 'c81e4b7a5d09'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tutorial_title_trgm', 'tutorial', ['title'], unique=False,
+            postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_dictionary_value_trgm', 'dictionary', ['value'], unique=False,
+            postgresql_using='gin', postgresql_ops={'value': 'gin_trgm_ops'}, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_dictionary_value_trgm', table_name='dictionary', postgresql_concurrently=True)
+        op.drop_index('ix_tutorial_title_trgm', table_name='tutorial', postgresql_concurrently=True)
@@ -0,0 +1,34 @@
+"""Tutorial visits
+
+Revision ID: 7f3e2a9c1b58
+Revises: e4b71c0a92d6
+Create Date: 2026-10-18 12:41:09.517236
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7f3e2a9c1b58'
+down_revision = 'e4b71c0a92d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tutorial_visits',
+        sa.Column('tutorial_id', sa.Integer(), nullable=False),
+        sa.Column('visits', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['tutorial_id'], ['tutorial.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tutorial_id')
+    )
+    op.create_index(
+        'ix_tutorial_visits_visits_tutorial_id', 'tutorial_visits', ['visits', 'tutorial_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tutorial_visits_visits_tutorial_id', table_name='tutorial_visits')
+    op.drop_table('tutorial_visits')
@@ -0,0 +1,29 @@
+"""Dictionary word code sequence
+
+Revision ID: 9a4f0b2d6c83
+Revises: 2c7d5e8a4f19
+Create Date: 2026-10-18 14:37:05.118427
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.schema import CreateSequence, DropSequence
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4f0b2d6c83'
+down_revision = '2c7d5e8a4f19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(CreateSequence(sa.Sequence('dictionary_word_code_seq')))
+    # the next code continues after the existing words
+    op.execute(
+        "SELECT setval('dictionary_word_code_seq', COALESCE((SELECT max(word_code) FROM dictionary), 0) + 1, false)"
+    )
+
+
+def downgrade() -> None:
+    op.execute(DropSequence(sa.Sequence('dictionary_word_code_seq')))
@@ -0,0 +1,40 @@
+"""Tutorial filter indexes
+
+Revision ID: a3f1c9d2e7b4
+Revises: 6b546c3e845e
+Create Date: 2026-10-18 09:12:40.518327
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f1c9d2e7b4'
+down_revision = '6b546c3e845e'
+branch_labels = None
+depends_on = None
+
+
+indexes = (
+    ('ix_tutorial_type_code', ['type_code']),
+    ('ix_tutorial_theme_code', ['theme_code']),
+    ('ix_tutorial_lang_code', ['lang_code']),
+    ('ix_tutorial_dist_type_code', ['dist_type_code']),
+    ('ix_tutorial_who_added_id', ['who_added_id']),
+    ('ix_tutorial_type_code_theme_code_id', ['type_code', 'theme_code', 'id']),
+    ('ix_tutorial_lang_code_type_code_id', ['lang_code', 'type_code', 'id']),
+    ('ix_tutorial_dist_type_code_lang_code_id', ['dist_type_code', 'lang_code', 'id']),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY doesn't lock the 'tutorial' table, but it can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in indexes:
+            op.create_index(name, 'tutorial', columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(indexes):
+            op.drop_index(name, table_name='tutorial', postgresql_concurrently=True)
@@ -0,0 +1,32 @@
+"""Tutorial source link hash
+
+Revision ID: b0c96d4e3f71
+Revises: 7f3e2a9c1b58
+Create Date: 2026-10-18 13:15:42.208763
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b0c96d4e3f71'
+down_revision = '7f3e2a9c1b58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # the old rows are hashed by 'python -m app.tutorial.links', which also reports their duplicates
+    op.add_column('tutorial', sa.Column('source_link_hash', sa.String(length=64), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tutorial_source_link_hash', 'tutorial', ['source_link_hash'], unique=True,
+            postgresql_where=sa.text('source_link_hash IS NOT NULL'), postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tutorial_source_link_hash', table_name='tutorial', postgresql_concurrently=True)
+    op.drop_column('tutorial', 'source_link_hash')
@@ -0,0 +1,68 @@
+"""Tutorial search vector
+
+Revision ID: c81e4b7a5d09
+Revises: a3f1c9d2e7b4
+Create Date: 2026-10-18 10:03:17.204561
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81e4b7a5d09'
+down_revision = 'a3f1c9d2e7b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tutorial', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # keep in sync with SEARCH_CONFIGS in app/common/constants.py
+    op.execute("""
+        CREATE FUNCTION tutorial_search_config(lang_code integer) RETURNS regconfig AS $$
+            SELECT CASE abbreviation
+                WHEN 'eng' THEN 'english'
+                WHEN 'rus' THEN 'russian'
+                ELSE 'simple'
+            END::regconfig
+            FROM language WHERE code = lang_code
+        $$ LANGUAGE sql STABLE
+    """)
+    op.execute("""
+        CREATE FUNCTION tutorial_search_vector_update() RETURNS trigger AS $$
+        DECLARE
+            config regconfig := coalesce(tutorial_search_config(NEW.lang_code), 'simple');
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector(config, coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector(config, coalesce(NEW.description, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tutorial_search_vector_update
+        BEFORE INSERT OR UPDATE OF title, description, lang_code ON tutorial
+        FOR EACH ROW EXECUTE FUNCTION tutorial_search_vector_update()
+    """)
+
+    # fill the existing rows through the trigger
+    op.execute("UPDATE tutorial SET title = title")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tutorial_search_vector', 'tutorial', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tutorial_search_vector', table_name='tutorial', postgresql_concurrently=True)
+    op.execute("DROP TRIGGER tutorial_search_vector_update ON tutorial")
+    op.execute("DROP FUNCTION tutorial_search_vector_update()")
+    op.execute("DROP FUNCTION tutorial_search_config(integer)")
+    op.drop_column('tutorial', 'search_vector')
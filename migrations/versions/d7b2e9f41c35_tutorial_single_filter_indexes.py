@@ -0,0 +1,48 @@
+"""Tutorial single filter indexes
+
+Revision ID: d7b2e9f41c35
+Revises: 3e8c1f7a2b94
+Create Date: 2026-10-18 18:05:27.314862
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7b2e9f41c35'
+down_revision = '3e8c1f7a2b94'
+branch_labels = None
+depends_on = None
+
+
+# a listing filtered by one column walks '(column, id)' in the order of the pagination
+indexes = (
+    ('ix_tutorial_type_code_id', ['type_code', 'id']),
+    ('ix_tutorial_theme_code_id', ['theme_code', 'id']),
+    ('ix_tutorial_lang_code_id', ['lang_code', 'id']),
+    ('ix_tutorial_dist_type_code_id', ['dist_type_code', 'id']),
+)
+# covered by the indexes with the same leading column
+replaced = (
+    ('ix_tutorial_type_code', ['type_code']),
+    ('ix_tutorial_theme_code', ['theme_code']),
+    ('ix_tutorial_lang_code', ['lang_code']),
+    ('ix_tutorial_dist_type_code', ['dist_type_code']),
+    ('ix_tutorial_who_added_id', ['who_added_id']),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in indexes:
+            op.create_index(name, 'tutorial', columns, unique=False, postgresql_concurrently=True)
+        for name, _ in replaced:
+            op.drop_index(name, table_name='tutorial', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in replaced:
+            op.create_index(name, 'tutorial', columns, unique=False, postgresql_concurrently=True)
+        for name, _ in reversed(indexes):
+            op.drop_index(name, table_name='tutorial', postgresql_concurrently=True)
@@ -0,0 +1,59 @@
+"""Tutorial timestamps and sort indexes
+
+Revision ID: e4b71c0a92d6
+Revises: 5d2a8f63b1e0
+Create Date: 2026-10-18 12:04:17.381920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b71c0a92d6'
+down_revision = '5d2a8f63b1e0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # existing rows get the migration time, the order between them falls back to 'id'
+    op.add_column('tutorial', sa.Column(
+        'created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+    ))
+    op.add_column('tutorial', sa.Column(
+        'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+    ))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tutorial_created_at_id', 'tutorial', ['created_at', 'id'], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tutorial_updated_at_id', 'tutorial', ['updated_at', 'id'], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tutorial_who_added_id_id', 'tutorial', ['who_added_id', 'id'], unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_tutorial_title_id', 'tutorial', ['title', 'id'], unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tutorial_lang_code_title_id', 'tutorial', ['lang_code', 'title', 'id'], unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_rating_id', 'user', ['rating', 'id'], unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_rating_id', table_name='user', postgresql_concurrently=True)
+        op.drop_index('ix_tutorial_lang_code_title_id', table_name='tutorial', postgresql_concurrently=True)
+        op.drop_index('ix_tutorial_title_id', table_name='tutorial', postgresql_concurrently=True)
+        op.drop_index('ix_tutorial_who_added_id_id', table_name='tutorial', postgresql_concurrently=True)
+        op.drop_index('ix_tutorial_updated_at_id', table_name='tutorial', postgresql_concurrently=True)
+        op.drop_index('ix_tutorial_created_at_id', table_name='tutorial', postgresql_concurrently=True)
+    op.drop_column('tutorial', 'updated_at')
+    op.drop_column('tutorial', 'created_at')
@@ -0,0 +1,28 @@
+"""Tutorial title sort index
+
+Revision ID: f2c6a1d8b357
+Revises: d7b2e9f41c35
+Create Date: 2026-10-18 18:31:52.907145
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c6a1d8b357'
+down_revision = 'd7b2e9f41c35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # the title sort goes by 'ix_tutorial_lang_code_title_id' with or without a language filter
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tutorial_title_id', table_name='tutorial', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tutorial_title_id', 'tutorial', ['title', 'id'], unique=False, postgresql_concurrently=True
+        )
@@ -0,0 +1,153 @@
+import asyncio
+import gzip
+import zlib
+from datetime import datetime, timezone
+from typing import Callable
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.testclient import TestClient
+from app.compression import CompressionMiddleware, GzipStream, negotiate
+from app.conditional import Validator, conditional, is_not_modified, validator_headers
+from conftest import client
+
+
+class TestApi:
+
+    def test_get_all_tutorials_positive(self):
+        response = client.get("/api/v1/tt/1")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["server-timing"].startswith("app;dur=")
+        assert "tutorials" in response.json()
+
+    def test_get_tutorial_negative(self):
+        response = client.get("/api/v1/tt/1/0")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": "Tutorial not found"}
+
+    def test_get_taxonomy_not_modified(self):
+        response = client.get("/api/v1/taxonomy/1")
+        assert response.status_code == status.HTTP_200_OK
+        assert {"types", "dist_types", "langs"} <= response.json().keys()
+
+        response = client.get("/api/v1/taxonomy/1", headers={"If-None-Match": response.headers["etag"]})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_get_types_not_modified(self):
+        response = client.get("/tp/1")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"].startswith('W/"')
+
+        response = client.get("/tp/1", headers={"If-None-Match": response.headers["etag"]})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not response.content
+
+
+class TestConditional:
+
+    validator = Validator(etag='W/"abc"', last_modified=datetime(2024, 1, 1, 12, 30, 15, 500, tzinfo=timezone.utc))
+
+    @staticmethod
+    def request(**headers: str) -> Request:
+        raw = [(key.replace("_", "-").encode(), value.encode()) for key, value in headers.items()]
+        return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": raw})
+
+    def test_not_modified_positive(self):
+        assert is_not_modified(self.request(if_none_match='"abc"'), self.validator)
+        assert is_not_modified(self.request(if_modified_since="Mon, 01 Jan 2024 12:30:15 GMT"), self.validator)
+        assert validator_headers(self.validator)["Last-Modified"] == "Mon, 01 Jan 2024 12:30:15 GMT"
+
+    def test_not_modified_negative(self):
+        assert not is_not_modified(self.request(), self.validator)
+        assert not is_not_modified(self.request(if_modified_since="Mon, 01 Jan 2024 12:30:14 GMT"), self.validator)
+        assert not is_not_modified(self.request(if_modified_since="yesterday"), self.validator)
+        # If-None-Match wins over If-Modified-Since
+        assert not is_not_modified(
+            self.request(if_none_match='"xyz"', if_modified_since="Mon, 01 Jan 2024 12:30:15 GMT"), self.validator
+        )
+
+    def test_conditional_positive(self):
+        calls = []
+
+        async def get_validator(**_):
+            return self.validator
+
+        @conditional(get_validator)
+        async def handler(request: Request) -> Response:
+            calls.append(request)
+            return Response("page")
+
+        response = asyncio.run(handler(request=self.request()))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] == 'W/"abc"'
+
+        response = asyncio.run(handler(request=self.request(if_none_match='W/"abc"')))
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert len(calls) == 1
+
+
+class TestCompression:
+
+    body = "tutorial " * 100
+
+    def client(self, make_response: Callable[[], Response]) -> TestClient:
+        async def app(scope, receive, send):
+            await make_response()(scope, receive, send)
+        return TestClient(CompressionMiddleware(app, levels={"gzip": 5}))
+
+    def test_negotiate_positive(self):
+        assert negotiate("gzip, deflate", ["br", "zstd", "gzip"]) == "gzip"
+        assert negotiate("gzip, br", ["br", "zstd", "gzip"]) == "br"
+        assert negotiate("gzip;q=1.0, br;q=0.5", ["br", "gzip"]) == "gzip"
+        assert negotiate("*", ["br", "gzip"]) == "br"
+
+    def test_negotiate_negative(self):
+        assert negotiate("", ["gzip"]) is None
+        assert negotiate("identity", ["gzip"]) is None
+        assert negotiate("gzip;q=0, *;q=0", ["gzip"]) is None
+        assert negotiate("gzip;q=x", ["gzip"]) is None
+
+    def test_compress_positive(self):
+        client = self.client(lambda: PlainTextResponse(self.body, headers={"ETag": '"abc"'}))
+        middleware = client.app
+
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.headers["server-timing"].endswith("compress-saved;dur=0.00")
+        assert response.text == self.body
+        assert (middleware.hits, middleware.misses) == (0, 1)
+
+        # the same body is compressed once
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.text == self.body
+        assert (middleware.hits, middleware.misses) == (1, 1)
+
+    def test_compress_stream_positive(self):
+        chunks = [self.body.encode(), self.body.encode()]
+        response = self.client(lambda: StreamingResponse(iter(chunks), media_type="text/html")).get(
+            "/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == self.body * 2
+
+    def test_stream_flush_positive(self):
+        # every chunk can be decompressed as soon as it arrives, the head of a streamed page isn't held back
+        stream = GzipStream(6)
+        decompressor = zlib.decompressobj(wbits=31)
+        assert decompressor.decompress(stream.compress(b"<head></head>", last=False)) == b"<head></head>"
+        assert decompressor.decompress(stream.compress(b"<body></body>", last=True)) == b"<body></body>"
+        assert decompressor.eof
+
+    def test_compress_negative(self):
+        headers = {"Accept-Encoding": "gzip"}
+        assert "content-encoding" not in self.client(lambda: PlainTextResponse("short")).get("/", headers=headers).headers
+        assert "content-encoding" not in self.client(lambda: Response(
+            self.body, media_type="image/png")).get("/", headers=headers).headers
+        assert "content-encoding" not in self.client(lambda: PlainTextResponse(self.body)).get(
+            "/", headers={"Accept-Encoding": "identity"}).headers
+        # already encoded
+        response = self.client(lambda: Response(gzip.compress(self.body.encode()), headers={"Content-Encoding": "gzip"})).get(
+            "/", headers=headers)
+        assert response.text == self.body
@@ -0,0 +1,67 @@
+import json
+from starlette.requests import Request
+from starlette.testclient import TestClient
+from app.assets import StaticAssets
+
+
+class TestStaticAssets:
+
+    def test_build_positive(self, tmp_path):
+        (tmp_path / "static").mkdir()
+        (tmp_path / "static" / "styles.css").write_text("body { margin: 0; }\n" * 100, encoding="utf-8")
+        assets = StaticAssets(tmp_path / "static", tmp_path / "build")
+        manifest = assets.build()
+
+        hashed = manifest["styles.css"]
+        assert hashed.startswith("styles.") and hashed.endswith(".css") and hashed != "styles.css"
+        assert (tmp_path / "build" / f"{hashed}.gz").exists()
+        assert json.loads((tmp_path / "build" / "manifest.json").read_text()) == manifest
+        assert assets.url("styles.css") == f"/static/{hashed}"
+        assert StaticAssets(tmp_path / "static", tmp_path / "build").build() == manifest
+
+    def test_serve_positive(self, tmp_path):
+        (tmp_path / "static").mkdir()
+        (tmp_path / "static" / "scripts.js").write_text("let a = 1;\n" * 100, encoding="utf-8")
+        assets = StaticAssets(tmp_path / "static", tmp_path / "build")
+        hashed = assets.build()["scripts.js"]
+        client = TestClient(assets)
+
+        response = client.get(f"/{hashed}", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "immutable" in response.headers["cache-control"]
+        assert response.text == "let a = 1;\n" * 100
+
+        response = client.get(f"/{hashed}", headers={"Accept-Encoding": "gzip;q=0, identity"})
+        assert "content-encoding" not in response.headers
+        assert response.text == "let a = 1;\n" * 100
+
+        response = client.get("/scripts.js", headers={"If-None-Match": response.headers["etag"]})
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "no-cache"
+        # a page rendered before a deployment
+        assert client.get("/scripts.0123456789ab.js").headers["cache-control"] == "no-cache"
+
+    def test_negotiate_positive(self, tmp_path):
+        (tmp_path / "static").mkdir()
+        (tmp_path / "static" / "styles.css").write_text("body { margin: 0; }\n" * 100, encoding="utf-8")
+        hashed = StaticAssets(tmp_path / "static", tmp_path / "build").build()["styles.css"]
+        (tmp_path / "build" / f"{hashed}.br").write_bytes(b"br")  # as if brotli was installed
+        assets = StaticAssets(tmp_path / "static", tmp_path / "build")
+        assets.build()
+
+        def encoding(accept_encoding: str) -> str | None:
+            headers = [(b"accept-encoding", accept_encoding.encode())]
+            scope = {"type": "http", "method": "GET", "path": f"/{hashed}", "query_string": b"", "headers": headers}
+            return assets.get_response(Request(scope)).headers.get("content-encoding")
+
+        assert encoding("gzip, br") == "br"
+        assert encoding("br;q=0, gzip") == "gzip"
+        assert encoding("br;q=0.5, gzip;q=0.8") == "gzip"
+        assert encoding("gzip;q=0") is None
+
+    def test_serve_negative(self, tmp_path):
+        (tmp_path / "static").mkdir()
+        client = TestClient(StaticAssets(tmp_path / "static", tmp_path / "build"))
+        assert client.get("/styles.css").status_code == 404
+        assert client.post("/styles.css").status_code == 405
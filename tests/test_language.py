@@ -0,0 +1,89 @@
+import json
+import pytest
+from fastapi import HTTPException
+from jinja2 import FileSystemBytecodeCache, TemplateSyntaxError
+from starlette.templating import Jinja2Templates
+from app.language.crud import accepted_langs
+from app.locales import Locales
+from starlette.requests import Request
+from app.render import precompile_templates, template_chunks
+
+
+class TestUILanguage:
+
+    def test_accepted_langs_positive(self):
+        assert accepted_langs("uk-UA,uk;q=0.9,en;q=0.8") == ["ukr", "ukr", "eng"]
+        assert accepted_langs("en;q=0.5, rus") == ["rus", "eng"]
+
+    def test_accepted_langs_negative(self):
+        assert accepted_langs("de;q=0, en;q=wrong") == []
+
+
+class TestLocales:
+
+    def test_fallback_positive(self, tmp_path):
+        (tmp_path / "eng").write_text(json.dumps({"loc_yes": "yes", "loc_no": "no"}), encoding="utf-8")
+        (tmp_path / "ukr").write_text(json.dumps({"loc_yes": "так"}), encoding="utf-8")
+        locales = Locales(tmp_path)
+
+        assert locales.get("ukr") == {"loc_yes": "так", "loc_no": "no"}
+        assert locales.get("xxx") == {"loc_yes": "yes", "loc_no": "no"}
+
+    def test_reload_negative(self, tmp_path):
+        (tmp_path / "eng").write_text(json.dumps({"loc_yes": "yes"}), encoding="utf-8")
+        locales = Locales(tmp_path)
+        locales.reload()
+
+        (tmp_path / "ukr").write_text(json.dumps({"yes": "так"}), encoding="utf-8")
+        with pytest.raises(HTTPException):
+            locales.reload()
+        assert locales.get("ukr") == {"loc_yes": "yes"}
+
+    def test_sync_positive(self, tmp_path):
+        (tmp_path / "eng").write_text(json.dumps({"loc_yes": "yes"}), encoding="utf-8")
+        admin_worker, other_worker = Locales(tmp_path), Locales(tmp_path)
+        admin_worker.reload()
+        other_worker.reload()
+        assert not other_worker.sync(admin_worker.version)  # the same files
+
+        (tmp_path / "eng").write_text(json.dumps({"loc_yes": "yes!"}), encoding="utf-8")
+        admin_worker.reload()
+        assert other_worker.get("eng") == {"loc_yes": "yes"}
+        assert other_worker.sync(admin_worker.version)
+        assert other_worker.get("eng") == {"loc_yes": "yes!"}
+        assert other_worker.version == admin_worker.version
+        assert not other_worker.sync(admin_worker.version)  # already seen
+
+    def test_sync_negative(self, tmp_path):
+        (tmp_path / "eng").write_text(json.dumps({"loc_yes": "yes"}), encoding="utf-8")
+        locales = Locales(tmp_path)
+        locales.reload()
+        version = locales.version
+        assert not locales.sync(None)  # nothing published
+        assert locales.version == version
+
+
+class TestTemplates:
+
+    def test_precompile_positive(self, tmp_path):
+        (tmp_path / "pages").mkdir()
+        (tmp_path / "pages" / "base.html").write_text("{{ loc_yes }}", encoding="utf-8")
+        (tmp_path / "pages" / "eng").write_text("{}", encoding="utf-8")
+        (tmp_path / "cache").mkdir()
+        jinja_templates = Jinja2Templates(
+            directory=tmp_path / "pages", bytecode_cache=FileSystemBytecodeCache(tmp_path / "cache"))
+
+        assert precompile_templates(jinja_templates) == 1
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+        assert jinja_templates.get_template("base.html").render(loc_yes="yes") == "yes"
+
+    def test_precompile_negative(self, tmp_path):
+        (tmp_path / "base.html").write_text("{% if %}", encoding="utf-8")
+        with pytest.raises(TemplateSyntaxError):
+            precompile_templates(Jinja2Templates(directory=tmp_path))
+
+    def test_stream_positive(self):
+        request = Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []})
+        chunks = list(template_chunks("base.html", {"request": request, "page": "exception", "code": 404}))
+        assert len(chunks) > 1
+        assert chunks[0].rstrip().endswith("</head>\n\n<body onload=\"getAllowedThemes(")
@@ -0,0 +1,260 @@
+import io
+import json
+from datetime import datetime, timezone
+from typing import List
+import pytest
+from fastapi import HTTPException
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from starlette import status
+from starlette.requests import Request
+from app.db import engine
+from app.pages import cached_response, page_key, page_tags, tag_page
+from app.registry import Registry
+from app.tools import decode_cursor, encode_cursor, normalize_url, url_hash
+from app.tutorial.bulk import BulkFormat, NameMaps, encode_batch, parse_record, read_records
+from app.tutorial.crud import cursor_value, tutorial_sort_keys
+from app.tutorial.fragments import FragmentCache, card_version
+from app.tutorial.models import TutorialModel
+from app.tutorial import visits
+from app.tutorial.schemas import DecodedTutorialSchema, TutorialSort
+from conftest import client
+
+
+class QueryCounter:
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(engine.sync_engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(engine.sync_engine, "before_cursor_execute", self)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+class TestTutorialQueries:
+
+    def test_tutorial_list_constant_queries(self):
+        with QueryCounter() as first_page:
+            response = client.get("/tt/1")
+        assert response.status_code == status.HTTP_200_OK
+
+        with QueryCounter() as empty_page:
+            response = client.get("/tt/1?page=100000")
+        assert response.status_code == status.HTTP_200_OK
+
+        # the number of tutorials on a page must not affect the number of queries
+        assert first_page.count == empty_page.count
+
+
+class TestTaxonomyRegistry:
+
+    def test_taxonomy_without_queries(self):
+        assert client.get("/tp/1").status_code == status.HTTP_200_OK  # the registry is loaded here at the latest
+
+        with QueryCounter() as counter:
+            for url in ("/tp/1", "/th/1", "/dt/1", "/lng/1"):
+                assert client.get(url).status_code == status.HTTP_200_OK
+        assert counter.count == 0
+
+
+    async def test_sync_negative(self, monkeypatch):
+        class PublishedVersion:
+            async def get(self, key):
+                return b"0123456789abcdef"
+
+        registry = Registry()
+        monkeypatch.setattr("app.registry.get_redis", lambda: PublishedVersion())
+        registry._published = b"0123456789abcdef"
+        assert not await registry.sync()  # already seen, no rebuild
+
+        monkeypatch.setattr("app.registry.get_redis", lambda: Redis(host="127.0.0.1", port=1))
+        with pytest.raises(RedisError):
+            await registry.sync()
+
+
+class TestTutorialSort:
+
+    def test_sort_cursor_positive(self):
+        created_at = datetime(2026, 10, 18, 12, 30, tzinfo=timezone.utc)
+        sort_keys, descending = tutorial_sort_keys(TutorialSort.newest)
+        _, _, *boundary = decode_cursor(encode_cursor("n", 2, created_at, 15))
+
+        assert descending
+        assert [cursor_value(key, value) for key, value in zip(sort_keys, boundary)] == [created_at, 15]
+
+    def test_title_sort_positive(self):
+        sort_keys, descending = tutorial_sort_keys(TutorialSort.title)
+        _, _, *boundary = decode_cursor(encode_cursor("n", 2, 1, "Основы", 15))
+
+        assert sort_keys[0] is TutorialModel.lang_code and not descending
+        assert [cursor_value(key, value) for key, value in zip(sort_keys, boundary)] == [1, "Основы", 15]
+
+    def test_default_sort_positive(self):
+        sort_keys, descending = tutorial_sort_keys(None)
+        assert len(sort_keys) == 1 and sort_keys[0] is TutorialModel.id
+        assert not descending
+
+
+class TestTutorialLinks:
+
+    def test_same_link_positive(self):
+        assert url_hash("HTTP://WWW.Example.com:80/docs/?b=2&utm_source=x&a=1#intro") == \
+               url_hash("https://example.com/docs?a=1&b=2")
+
+    def test_different_link_negative(self):
+        assert normalize_url("https://example.com/Docs") != normalize_url("https://example.com/docs")
+        assert normalize_url("https://example.com/docs?page=2") != normalize_url("https://example.com/docs")
+
+
+class TestTutorialCards:
+
+    tutor = DecodedTutorialSchema(
+        id=1, title="Python Basics", description="All the basics", source_link="https://example.com",
+        type_code=1, type="Programming", theme_code=2, theme="Python", lang_code=3, language="English",
+        dist_type_code=4, dist_type="Free", who_added_id=5, who_added="admin", who_added_is_active=True,
+        updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+    def test_lru_positive(self):
+        cards = FragmentCache(size=2)
+        cards.set((1, 1, "v"), "one")
+        cards.set((2, 1, "v"), "two")
+        assert cards.get((1, 1, "v")) == "one"
+        cards.set((3, 1, "v"), "three")
+
+        assert cards.get((2, 1, "v")) is None
+        assert cards.get((1, 1, "v")) == "one"
+        cards.invalidate(1)
+        assert cards.get((1, 1, "v")) is None
+        assert cards.get((3, 1, "v")) == "three"
+
+    def test_version_negative(self):
+        version: str = card_version(self.tutor, "taxonomy", "locale")
+        assert version == card_version(self.tutor.copy(), "taxonomy", "locale")
+        assert version != card_version(self.tutor, "renamed", "locale")
+        assert version != card_version(self.tutor, "taxonomy", "reloaded")
+        assert version != card_version(self.tutor.copy(update={"who_added_is_active": False}), "taxonomy", "locale")
+        assert version != card_version(
+            self.tutor.copy(update={"updated_at": datetime(2024, 1, 2, tzinfo=timezone.utc)}), "taxonomy", "locale")
+
+
+class TestPageCache:
+
+    @staticmethod
+    def request(query: bytes = b"", headers: List[tuple] | None = None) -> Request:
+        return Request({"type": "http", "method": "GET", "path": "/tt/1", "query_string": query, "headers": headers or []})
+
+    def test_key_positive(self):
+        assert page_key(self.request(b"b=2&a=1"), 1) == page_key(self.request(b"a=1&b=2"), 1) == "page-html:1:/tt/1?a=1&b=2"
+        assert page_key(self.request(b"a=1"), 1) != page_key(self.request(b"a=1"), 2)
+
+    def test_tags_positive(self):
+        tag_page("tutorial:1")
+        assert page_tags.get() is None
+
+        token = page_tags.set({"lang:1"})
+        tag_page("tutorial:1", "user:2")
+        assert page_tags.get() == {"lang:1", "tutorial:1", "user:2"}
+        page_tags.reset(token)
+
+    def test_cached_response_positive(self):
+        response = cached_response({b"body": b"<html></html>", b"media_type": b"text/html"})
+        assert "content-encoding" not in response.headers
+        assert response.body == b"<html></html>"
+        assert response.media_type == "text/html"
+
+
+class TestTutorialVisits:
+
+    async def test_count_visit_negative(self, monkeypatch):
+        # nothing listens there, the redirect still goes to the DB for the link
+        monkeypatch.setattr(visits, "get_redis", lambda: Redis(host="127.0.0.1", port=1))
+        assert await visits.count_visit(1) is None
+        await visits.cache_link(1, "https://example.com")
+
+
+class TestTutorialImport:
+
+    maps = NameMaps(
+        types={"programming": 1},
+        themes={(1, "python"): 2},
+        dist_types={"free": 3},
+        langs={"english": 4, "eng": 4},
+    )
+
+    def test_read_records_positive(self):
+        stream = io.StringIO(
+            "title,description,source_link,type,theme,language,dist_type\n"
+            "Python Basics,All the basics,https://example.com,Programming,Python,eng,free\n"
+        )
+        assert list(read_records(stream, BulkFormat.csv)) == [(2, {
+            "title": "Python Basics",
+            "description": "All the basics",
+            "source_link": "https://example.com",
+            "type": "Programming",
+            "theme": "Python",
+            "language": "eng",
+            "dist_type": "free",
+        })]
+
+    def test_parse_record_positive(self):
+        record = json.dumps({
+            "title": "Python  Basics",
+            "description": "All the basics",
+            "source_link": "https://example.com",
+            "type": "programming",
+            "theme": " Python ",
+            "language": "English",
+            "dist_type": "FREE",
+        })
+        tutor = parse_record(record, self.maps, who_added_id=5)
+        assert (tutor.title, tutor.type_code, tutor.theme_code, tutor.lang_code, tutor.dist_type_code) == \
+               ("Python Basics", 1, 2, 4, 3)
+        assert tutor.who_added_id == 5
+
+    def test_parse_record_negative(self):
+        record = {
+            "title": "Python Basics",
+            "description": "All the basics",
+            "source_link": "https://example.com",
+            "type": "Programming",
+            "theme": "Rust",
+            "language": "eng",
+            "dist_type": "free",
+        }
+        with pytest.raises(ValueError):
+            parse_record(record, self.maps, who_added_id=5)
+
+    def test_import_format_negative(self):
+        with pytest.raises(HTTPException):
+            BulkFormat.from_filename("tutorials.xlsx")
+
+
+class TestTutorialExport:
+
+    rows = [
+        {"id": 1, "title": "Первый", "updated_at": datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)},
+        {"id": 2, "title": "Second", "updated_at": None},
+    ]
+
+    def test_encode_ndjson_positive(self):
+        lines = encode_batch(self.rows, BulkFormat.ndjson, header=True).decode().splitlines()
+        assert json.loads(lines[0]) == {"id": 1, "title": "Первый", "updated_at": "2024-01-01T12:30:00+00:00"}
+        assert json.loads(lines[1])["updated_at"] is None
+
+    def test_encode_csv_positive(self):
+        assert encode_batch(self.rows, BulkFormat.csv, header=True).decode().splitlines() == [
+            "id,title,updated_at", "1,Первый,2024-01-01T12:30:00+00:00", "2,Second,",
+        ]
+        assert not encode_batch(self.rows, BulkFormat.csv, header=False).decode().startswith("id,")